@@ -2,12 +2,23 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+from functools import lru_cache
 import json
 import sqlitecloud
 
+@lru_cache(maxsize=None)
+def plotly_express():
+    """Import plotly.express on first use"""
+    import plotly.express as px
+    return px
+
+@lru_cache(maxsize=None)
+def plotly_graph_objects():
+    """Import plotly.graph_objects on first use"""
+    import plotly.graph_objects as go
+    return go
+
 # SQLite Cloud configuration
 SQLITECLOUD_CONFIG = {
     "connection_string": "sqlitecloud://ctoxm6jkvz.g4.sqlite.cloud:8860/compliance_survey.db?apikey=UoEbilyXxrbfqDUjsrbiLxUZQkRMtyK9fbhIzKVFuAw"
@@ -91,16 +102,15 @@ class ComplianceAnalytics:
             df = pd.DataFrame(result_data, columns=columns)
             
             procedures_data = []
-            for _, row in df.iterrows():
-                if row['procedures_json'] and row['procedures_json'] != 'null' and row['procedures_json'] != '[]':
+            context_columns = ['interview_id', 'business_name', 'district', 'primary_sector', 'business_size']
+            rows = zip(df['procedures_json'].tolist(), df[context_columns].itertuples(index=False, name=None))
+            for procedures_json, context in rows:
+                if procedures_json and procedures_json != 'null' and procedures_json != '[]':
                     try:
-                        procedures = json.loads(row['procedures_json'])
+                        procedures = json.loads(procedures_json)
+                        interview_context = dict(zip(context_columns, context))
                         for proc in procedures:
-                            proc['interview_id'] = row['interview_id']
-                            proc['business_name'] = row['business_name']
-                            proc['district'] = row['district']
-                            proc['primary_sector'] = row['primary_sector']
-                            proc['business_size'] = row['business_size']
+                            proc.update(interview_context)
                             procedures_data.append(proc)
                     except Exception as e:
                         continue
@@ -168,6 +178,7 @@ class ComplianceAnalytics:
 
 def display_overview_metrics(df, procedures_df):
     """Display overview metrics and visualizations"""
+    px = plotly_express()
     st.header("📈 Compliance Overview")
     
     col1, col2, col3, col4 = st.columns(4)
@@ -219,6 +230,7 @@ def display_overview_metrics(df, procedures_df):
 
 def display_cost_matrix(analytics, procedures_df):
     """Display compliance cost matrix"""
+    px = plotly_express()
     st.header("💰 Compliance Cost Matrix")
     
     matrix_df = analytics.create_compliance_matrix(procedures_df)
@@ -278,6 +290,7 @@ def display_cost_matrix(analytics, procedures_df):
 
 def display_sector_analysis(analytics, df, procedures_df):
     """Display sector-wise analysis"""
+    px = plotly_express()
     st.header("🏢 Sector Analysis")
     
     sector_df = analytics.create_sector_analysis(df, procedures_df)
@@ -344,6 +357,8 @@ def display_sector_analysis(analytics, df, procedures_df):
 
 def display_time_analysis(procedures_df):
     """Display time analysis visualizations"""
+    px = plotly_express()
+    go = plotly_graph_objects()
     st.header("⏱️ Time Analysis")
     
     if procedures_df.empty:
@@ -392,6 +407,7 @@ def display_time_analysis(procedures_df):
 
 def display_procedure_details(procedures_df):
     """Display detailed procedure analysis"""
+    px = plotly_express()
     st.header("📋 Procedure Details Analysis")
     
     if procedures_df.empty:
@@ -470,6 +486,7 @@ def generate_powerbi_dataset(df, procedures_df):
 
 def display_data_export(analytics, df, procedures_df):
     """Display data export options"""
+    px = plotly_express()
     st.header("🔗 Data Export & Integration")
     
     st.subheader("📊 Power BI Integration")
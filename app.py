@@ -5,12 +5,15 @@ import numpy as np
 from datetime import datetime, date, time
 import json
 import os
-import plotly.express as px
-import plotly.graph_objects as go
+from contextlib import contextmanager
 import io
+import csv
+import queue
 import base64
 import hashlib
+import hmac
 import sqlitecloud
+from streamlit.errors import StreamlitAPIException
 
 # Import modules
 try:
@@ -57,13 +60,85 @@ def get_connection():
         st.error(f"❌ Database connection error: {str(e)}")
         return None
 
-def execute_query(query, params=None, return_result=False):
-    """Execute a query on SQLite Cloud"""
-    conn = get_connection()
+CONNECTION_POOL_SIZE = 4
+
+@st.cache_resource(show_spinner=False)
+def get_connection_pool():
+    """Get the process-wide queue of idle SQLite Cloud connections"""
+    return queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+
+# Errors that mean the connection itself is unusable, as opposed to a failed statement
+CONNECTION_ERRORS = tuple(
+    getattr(sqlitecloud, name) for name in ('OperationalError', 'InterfaceError') if hasattr(sqlitecloud, name)
+) + (OSError,)
+
+def connection_alive(conn):
+    """Check that an idle pooled connection still reaches the server"""
+    try:
+        conn.cursor().execute("SELECT 1").fetchone()
+        return True
+    except CONNECTION_ERRORS:
+        return False
+
+@contextmanager
+def pooled_connection(fresh=False, check=False):
+    """Borrow a pooled connection, or open a new one when fresh; check pings a reused connection first"""
+    pool = get_connection_pool()
+    conn = None
+    if not fresh:
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            pass
+    if conn is not None and check and not connection_alive(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        conn = None
     if conn is None:
-        return None
+        conn = sqlitecloud.connect(SQLITECLOUD_CONFIG["connection_string"])
     
     try:
+        yield conn
+    except CONNECTION_ERRORS:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        raise
+    except Exception:
+        # The statement failed but the connection is fine; roll back and keep it
+        try:
+            conn.rollback()
+            pool.put_nowait(conn)
+        except Exception:
+            conn.close()
+        raise
+    
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+def run_with_connection(operation, is_write=False):
+    """Run operation(conn) on a pooled connection, replacing it if the server dropped it"""
+    if is_write:
+        # Writes are never replayed, so a reused connection is checked before anything is sent
+        with pooled_connection(check=True) as conn:
+            return operation(conn)
+    
+    # Reads are safe to repeat once on a new connection
+    try:
+        with pooled_connection() as conn:
+            return operation(conn)
+    except CONNECTION_ERRORS:
+        with pooled_connection(fresh=True) as conn:
+            return operation(conn)
+
+def execute_query(query, params=None, return_result=False):
+    """Execute a query on SQLite Cloud"""
+    def run_query(conn):
         cursor = conn.cursor()
         if params:
             cursor.execute(query, params)
@@ -81,29 +156,26 @@ def execute_query(query, params=None, return_result=False):
         else:
             conn.commit()
             return True
-            
+    
+    try:
+        return run_with_connection(run_query, is_write=not query.strip().upper().startswith('SELECT'))
     except Exception as e:
         st.error(f"❌ Query execution error: {str(e)}")
         return None
-    finally:
-        conn.close()
 
 def execute_many(query, params_list):
     """Execute many queries on SQLite Cloud"""
-    conn = get_connection()
-    if conn is None:
-        return None
-    
-    try:
+    def run_batch(conn):
         cursor = conn.cursor()
         cursor.executemany(query, params_list)
         conn.commit()
         return True
+    
+    try:
+        return run_with_connection(run_batch, is_write=True)
     except Exception as e:
         st.error(f"❌ Batch execution error: {str(e)}")
         return None
-    finally:
-        conn.close()
 
 # Set page config MUST be first
 st.set_page_config(
@@ -128,6 +200,16 @@ ADMIN_CREDENTIALS = {
     "researcher": {"password": "data2024", "role": "researcher"}
 }
 
+def password_digest(password):
+    """SHA-256 digest of a password"""
+    return hashlib.sha256(password.encode()).digest()
+
+# Password digests are computed once so a login attempt only hashes the entered password
+PASSWORD_DIGESTS = {
+    username: password_digest(details["password"])
+    for username, details in {**INTERVIEWER_CREDENTIALS, **ADMIN_CREDENTIALS}.items()
+}
+
 # Initialize database
 def init_db():
     """Initialize database tables in SQLite Cloud"""
@@ -229,6 +311,10 @@ def init_db():
 
 def check_and_fix_database():
     """Check database schema and fix if needed"""
+    # The schema was already verified and migrated during this session's bootstrap
+    if st.session_state.get('bootstrapped'):
+        return True
+    
     try:
         result = execute_query("SELECT name FROM sqlite_master WHERE type='table' AND name='responses'", return_result=True)
         
@@ -241,6 +327,25 @@ def check_and_fix_database():
         st.error(f"Error checking database: {str(e)}")
         return init_db()
 
+DATABASE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_responses_business_name ON responses(business_name)",
+    "CREATE INDEX IF NOT EXISTS idx_responses_created_by ON responses(created_by)",
+    "CREATE INDEX IF NOT EXISTS idx_responses_status ON responses(status)",
+    "CREATE INDEX IF NOT EXISTS idx_responses_last_modified ON responses(last_modified DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_admin_logs_timestamp ON admin_logs(timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_user_sessions_login_time ON user_sessions(login_time DESC)"
+]
+
+def add_missing_indexes():
+    """Create indexes for the columns used in lookups and sorting"""
+    try:
+        for index_query in DATABASE_INDEXES:
+            execute_query(index_query)
+        return True
+    except Exception as e:
+        st.warning(f"Database index update: {str(e)}")
+        return False
+
 def add_missing_columns():
     """Add missing columns to existing database tables"""
     try:
@@ -289,14 +394,14 @@ def initialize_session_state():
         'active_procedure_index': None,
         'district_specific_notes': {},
         'isic_df': None,
-        'business_activities_text': "",
         'bulk_procedure_mode': False,
         'quick_manual_mode': False,
         'admin_logged_in': False,
         'interviewer_logged_in': False,
         'current_user': None,
         'user_role': None,
-        'app_mode': 'login'
+        'app_mode': 'login',
+        'db_version': 0
     }
     
     for key, value in defaults.items():
@@ -306,19 +411,218 @@ def initialize_session_state():
 # Application modes
 APPLICATION_MODES = ["Entirely In-Person", "Mixed", "Entirely Online"]
 DISTRICTS = ["Lusaka", "Kitwe", "Kasama", "Ndola", "Livingstone", "Other (Please specify)"]
+SECTORS = ["Agribusiness", "Construction"]
+LEGAL_STATUSES = ["Sole Proprietor", "Partnership", "Limited Liability Company", "Public Limited Company", "Other"]
+BUSINESS_SIZES = ["Micro (1-9)", "Small (10-49)", "Medium (50-249)", "Large (250+)"]
+OWNERSHIP_STRUCTURES = ["100% Zambian-owned", "Partially Foreign-owned", "Majority/Fully Foreign-owned", "Other"]
+OWNER_GENDERS = ["Male", "Female", "Joint (M/F)"]
+TURNOVER_RANGES = ["< 500,000", "500,000 - 1M", "1M - 5M", "5M - 10M", "10M - 50M", "> 50M"]
+PROCEDURE_STATUSES = ["Not Started", "In Progress", "Completed", "Delayed", "Rejected"]
 INTERVIEWERS = list(INTERVIEWER_CREDENTIALS.keys())
+ADMIN_USERS = list(ADMIN_CREDENTIALS.keys())
+INTERVIEWS_PAGE_SIZE = 50
+INTERVIEW_SUMMARY_COLUMNS = ['interview_id', 'business_name', 'district', 'primary_sector',
+                             'status', 'submission_date', 'risk_score']
+INTERVIEW_DETAIL_COLUMNS = ['business_name', 'district', 'primary_sector', 'business_size', 'legal_status',
+                            'total_compliance_cost', 'total_compliance_time', 'risk_score', 'status',
+                            'procedure_data', 'reform_priorities']
+INTERVIEW_CATEGORY_COLUMNS = ['status', 'district', 'primary_sector']
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+PROCEDURE_TABLE_COLUMNS = ['procedure', 'authority', 'status', 'application_mode', 'complexity',
+                           'total_days', 'official_fees', 'unofficial_payments']
+EXPANDED_LICENSES = {
+    "Agribusiness": {
+        "PACRA Business Registration": {
+            "authority": "PACRA", "renewable": "No", "renewal_frequency": "One-time",
+            "common_documents": ["Application form", "Business name reservation", "Identification documents"],
+            "typical_cost": 1000, "typical_days": 14, "complexity": 3
+        },
+        "ZRA Tax Registration": {
+            "authority": "ZRA", "renewable": "No", "renewal_frequency": "One-time", 
+            "common_documents": ["PACRA certificate", "Business registration", "Owner identification"],
+            "typical_cost": 0, "typical_days": 7, "complexity": 2
+        },
+        "Local Trading License": {
+            "authority": "Local Council", "renewable": "Yes", "renewal_frequency": "Annual",
+            "common_documents": ["Application form", "Business premises details", "Health certificate"],
+            "typical_cost": 1500, "typical_days": 21, "complexity": 4
+        }
+    },
+    "Construction": {
+        "NCC Registration": {
+            "authority": "NCC", "renewable": "Yes", "renewal_frequency": "Annual",
+            "common_documents": ["Company registration", "Technical staff certificates", "Equipment list"],
+            "typical_cost": 5000, "typical_days": 30, "complexity": 7
+        },
+        "Building Permit": {
+            "authority": "Local Council", "renewable": "No", "renewal_frequency": "Project-based",
+            "common_documents": ["Architectural drawings", "Structural designs", "Site plans"],
+            "typical_cost": 2500, "typical_days": 45, "complexity": 6
+        }
+    }
+}
+REFORM_OPTIONS = [
+    "Simplify application procedures",
+    "Reduce number of required documents",
+    "Standardize forms across agencies",
+    "Create single-window clearance system",
+    "Set maximum processing time limits",
+    "Implement online tracking systems",
+    "Lower official fees for small businesses",
+    "Provide fee waivers for startups",
+    "Full online application system",
+    "Digital document submission",
+    "Publish clear requirements online",
+    "Provide status updates automatically",
+    "Better inter-agency coordination",
+    "Training for regulatory staff"
+]
+REFORM_OPTION_PAIRS = [(f"reform_{i}", reform) for i, reform in enumerate(REFORM_OPTIONS)]
+
+# Widget key -> form_data field for each section form
+SECTION_A_FIELDS = [
+    ('interviewer_name', 'interviewer_name'),
+    ('interview_date', 'interview_date'),
+    ('start_time', 'start_time'),
+    ('end_time', 'end_time'),
+    ('business_name', 'business_name'),
+    ('district', 'district'),
+    ('physical_address', 'physical_address'),
+    ('contact_person', 'contact_person'),
+    ('email', 'email'),
+    ('phone', 'phone'),
+    ('primary_sector', 'primary_sector'),
+    ('legal_status', 'legal_status'),
+    ('business_size', 'business_size'),
+    ('ownership', 'ownership_structure'),
+    ('gender_owner', 'gender_owner'),
+    ('business_activities_form', 'business_activities'),
+    ('year_established', 'year_established'),
+    ('turnover_range', 'turnover_range'),
+    ('employees_fulltime', 'employees_fulltime'),
+    ('employees_parttime', 'employees_parttime')
+]
+SECTION_C_FIELDS = [
+    ('local_time', 'completion_time_local'),
+    ('national_time', 'completion_time_national'),
+    ('dk_time', 'completion_time_dk'),
+    ('cost_percentage', 'compliance_cost_percentage'),
+    ('permit_national', 'permit_comparison_national'),
+    ('permit_local', 'permit_comparison_local'),
+    ('cost_national', 'cost_comparison_national'),
+    ('cost_local', 'cost_comparison_local'),
+    ('climate_rating', 'business_climate_rating')
+]
+
+SECTION_A_COLUMNS = [field for _, field in SECTION_A_FIELDS] + ['isic_codes']
+SECTION_C_COLUMNS = [field for _, field in SECTION_C_FIELDS]
+JSON_COLUMNS = {'isic_codes', 'reform_priorities', 'procedure_data'}
+# Every responses column the survey form writes, in table order
+DRAFT_FORM_COLUMNS = [
+    'interviewer_name', 'interview_date', 'start_time', 'end_time', 'business_name', 'district',
+    'physical_address', 'contact_person', 'email', 'phone', 'primary_sector', 'legal_status',
+    'business_size', 'ownership_structure', 'gender_owner', 'business_activities', 'isic_codes',
+    'year_established', 'turnover_range', 'employees_fulltime', 'employees_parttime', 'procedure_data',
+    'completion_time_local', 'completion_time_national', 'completion_time_dk', 'compliance_cost_percentage',
+    'permit_comparison_national', 'permit_comparison_local', 'cost_comparison_national',
+    'cost_comparison_local', 'business_climate_rating', 'reform_priorities'
+]
+# Numeric columns default to 0 when saved, as on insert; everything else defaults to ''
+NUMERIC_COLUMN_DEFAULTS = {
+    'year_established': 0, 'employees_fulltime': 0, 'employees_parttime': 0,
+    'completion_time_local': 0.0, 'completion_time_national': 0.0, 'completion_time_dk': 0.0,
+    'compliance_cost_percentage': 0.0, 'permit_comparison_national': 0, 'permit_comparison_local': 0,
+    'cost_comparison_national': 0, 'cost_comparison_local': 0, 'business_climate_rating': 0
+}
+
+def form_value(value):
+    """Convert a widget value to its form_data representation"""
+    return value.isoformat() if isinstance(value, (date, time)) else value
+
+def compact_json(value):
+    """Serialize a JSON column value without the default separator whitespace"""
+    return json.dumps(value, separators=(',', ':'))
+
+def collect_form_fields(fields):
+    """Read a section's widget values into form_data fields"""
+    return {field: form_value(st.session_state[key]) for key, field in fields}
+
+def rerun_fragment():
+    """Rerun only the calling fragment, or the whole app when not in a fragment rerun"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+# SQL statements, kept as constants so every call sends identical text
+ALL_INTERVIEWS_QUERY = """
+SELECT 
+    interview_id, business_name, district, primary_sector, 
+    business_size, status, submission_date, last_modified,
+    total_compliance_cost, total_compliance_time, risk_score, created_by
+FROM responses 
+ORDER BY last_modified DESC
+"""
+USER_INTERVIEWS_QUERY = """
+SELECT 
+    interview_id, business_name, district, primary_sector, 
+    business_size, status, submission_date, last_modified,
+    total_compliance_cost, total_compliance_time, risk_score
+FROM responses 
+WHERE created_by = ?
+ORDER BY last_modified DESC
+"""
+INTERVIEWS_PAGE_QUERY = f"""
+SELECT {', '.join(INTERVIEW_SUMMARY_COLUMNS)}
+FROM responses 
+ORDER BY last_modified DESC
+LIMIT ? OFFSET ?
+"""
+DUPLICATE_BUSINESS_NAME_QUERY = "SELECT 1 FROM responses WHERE business_name = ? AND (? IS NULL OR interview_id != ?) LIMIT 1"
+SUBMIT_INTERVIEW_QUERY = "UPDATE responses SET status = 'submitted', submission_date = ? WHERE interview_id = ?"
+ADMIN_LOG_INSERT_QUERY = "INSERT INTO admin_logs (username, action, timestamp, details) VALUES (?, ?, ?, ?)"
+SESSION_LOG_INSERT_QUERY = "INSERT INTO user_sessions (username, login_time, logout_time, session_duration) VALUES (?, ?, ?, ?)"
+RECENT_SESSIONS_QUERY = "SELECT * FROM user_sessions ORDER BY login_time DESC LIMIT 100"
+RECENT_ADMIN_LOGS_QUERY = "SELECT * FROM admin_logs ORDER BY timestamp DESC LIMIT 100"
+STATS_SUMMARY_QUERY = """
+    SELECT COUNT(*) AS total_interviews,
+           COALESCE(SUM(status = 'submitted'), 0) AS submitted_interviews,
+           COALESCE(SUM(status = 'draft'), 0) AS draft_interviews,
+           COALESCE(SUM(created_by = ?), 0) AS user_interviews,
+           AVG(CASE WHEN status = 'submitted' THEN total_compliance_cost END) AS avg_cost,
+           AVG(CASE WHEN status = 'submitted' THEN total_compliance_time END) AS avg_time,
+           AVG(CASE WHEN status = 'submitted' THEN risk_score END) AS avg_risk
+    FROM responses
+"""
+SECTOR_DISTRIBUTION_QUERY = "SELECT primary_sector, COUNT(*) AS count FROM responses GROUP BY primary_sector"
+DISTRICT_DISTRIBUTION_QUERY = "SELECT district, COUNT(*) AS count FROM responses GROUP BY district"
 
 # Database functions
-def save_draft(data, interview_id=None):
-    """Save form data as draft"""
+def bump_db_version():
+    """Invalidate cached query results after a write, for every session"""
+    st.session_state.db_version = st.session_state.get('db_version', 0) + 1
+    # st.cache_data is shared by the whole process, so other sessions' entries must go too
+    for cached_query in (cached_duplicate_business_name, cached_interview_count, cached_all_interviews,
+                         cached_user_interviews, user_status_counts, user_csv_bytes, cached_database_stats,
+                         export_csv_bytes, export_excel_bytes, export_json_bytes, get_user_statistics):
+        cached_query.clear()
+
+def save_draft(data, interview_id=None, columns=None):
+    """Save form data as draft in one upsert, writing only the given columns of an existing draft"""
     try:
-        if not interview_id:
+        is_new_draft = not interview_id
+        if is_new_draft:
             interview_id = generate_interview_id()
         
         # Calculate total compliance metrics
         procedure_data = data.get('procedure_data', [])
-        total_cost = sum(proc.get('official_fees', 0) + proc.get('unofficial_payments', 0) for proc in procedure_data)
-        total_time = sum(proc.get('total_days', 0) for proc in procedure_data)
+        procedure_totals = np.array(
+            [(proc.get('official_fees', 0), proc.get('unofficial_payments', 0), proc.get('total_days', 0))
+             for proc in procedure_data],
+            dtype=np.float64
+        ).reshape(-1, 3)
+        total_cost = float(procedure_totals[:, :2].sum())
+        total_time = int(procedure_totals[:, 2].sum())
         
         # Calculate risk score
         risk_score = min((total_cost / 100000 + total_time / 365) * 10, 10)
@@ -327,142 +631,41 @@ def save_draft(data, interview_id=None):
         draft_manager = DraftManager()
         progress = draft_manager.calculate_progress(data, st.session_state.current_section)
         
-        # Prepare data
-        isic_codes = data.get('isic_codes', [])
-        reform_priorities = data.get('reform_priorities', [])
-        procedure_data_json = json.dumps(procedure_data)
-        
+        # New drafts write every form column; existing drafts only the saved section's
+        columns = list(DRAFT_FORM_COLUMNS if is_new_draft or not columns else columns)
+        # Column names go into the SQL text, so only known form columns are accepted
+        unknown_columns = [column for column in columns if column not in DRAFT_FORM_COLUMNS]
+        if unknown_columns:
+            raise ValueError(f"Unknown draft columns: {', '.join(unknown_columns)}")
+        values = {column: compact_json(data.get(column, [])) if column in JSON_COLUMNS
+                  else data.get(column, NUMERIC_COLUMN_DEFAULTS.get(column, ''))
+                  for column in columns}
+        if 'procedure_data' in values:
+            values.update({
+                'total_compliance_cost': total_cost,
+                'total_compliance_time': total_time,
+                'risk_score': risk_score
+            })
         current_time = datetime.now().isoformat()
-        
-        # Check if record exists
-        existing_result = execute_query("SELECT id FROM responses WHERE interview_id = ?", (interview_id,), return_result=True)
-        
-        if existing_result and isinstance(existing_result, tuple) and existing_result[0]:
-            # Update existing draft
-            update_query = '''
-                UPDATE responses SET
-                    interviewer_name=?, interview_date=?, start_time=?, end_time=?,
-                    business_name=?, district=?, physical_address=?, contact_person=?,
-                    email=?, phone=?, primary_sector=?, legal_status=?, business_size=?,
-                    ownership_structure=?, gender_owner=?, business_activities=?,
-                    isic_codes=?, year_established=?, turnover_range=?,
-                    employees_fulltime=?, employees_parttime=?, procedure_data=?,
-                    completion_time_local=?, completion_time_national=?, completion_time_dk=?,
-                    compliance_cost_percentage=?, permit_comparison_national=?,
-                    permit_comparison_local=?, cost_comparison_national=?,
-                    cost_comparison_local=?, business_climate_rating=?,
-                    reform_priorities=?, last_modified=?, total_compliance_cost=?,
-                    total_compliance_time=?, risk_score=?, created_by=?,
-                    current_section=?, draft_progress=?
-                WHERE interview_id=?
-            '''
-            params = (
-                data.get('interviewer_name', ''),
-                data.get('interview_date', ''),
-                data.get('start_time', ''),
-                data.get('end_time', ''),
-                data.get('business_name', ''),
-                data.get('district', ''),
-                data.get('physical_address', ''),
-                data.get('contact_person', ''),
-                data.get('email', ''),
-                data.get('phone', ''),
-                data.get('primary_sector', ''),
-                data.get('legal_status', ''),
-                data.get('business_size', ''),
-                data.get('ownership_structure', ''),
-                data.get('gender_owner', ''),
-                data.get('business_activities', ''),
-                json.dumps(isic_codes),
-                data.get('year_established', 0),
-                data.get('turnover_range', ''),
-                data.get('employees_fulltime', 0),
-                data.get('employees_parttime', 0),
-                procedure_data_json,
-                data.get('completion_time_local', 0.0),
-                data.get('completion_time_national', 0.0),
-                data.get('completion_time_dk', 0.0),
-                data.get('compliance_cost_percentage', 0.0),
-                data.get('permit_comparison_national', 0),
-                data.get('permit_comparison_local', 0),
-                data.get('cost_comparison_national', 0),
-                data.get('cost_comparison_local', 0),
-                data.get('business_climate_rating', 0),
-                json.dumps(reform_priorities),
-                current_time,
-                total_cost,
-                total_time,
-                risk_score,
-                st.session_state.current_user,
-                st.session_state.current_section,
-                progress,
-                interview_id
-            )
-            result = execute_query(update_query, params)
-        else:
-            # Insert new draft
-            insert_query = '''
-                INSERT INTO responses (
-                    interview_id, interviewer_name, interview_date, start_time, end_time,
-                    business_name, district, physical_address, contact_person, email,
-                    phone, primary_sector, legal_status, business_size, ownership_structure,
-                    gender_owner, business_activities, isic_codes, year_established,
-                    turnover_range, employees_fulltime, employees_parttime, procedure_data,
-                    completion_time_local, completion_time_national, completion_time_dk,
-                    compliance_cost_percentage, permit_comparison_national,
-                    permit_comparison_local, cost_comparison_national, cost_comparison_local,
-                    business_climate_rating, reform_priorities, status, submission_date,
-                    last_modified, total_compliance_cost, total_compliance_time, risk_score,
-                    created_by, current_section, draft_progress
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            insert_data = (
-                interview_id,
-                data.get('interviewer_name', ''),
-                data.get('interview_date', ''),
-                data.get('start_time', ''),
-                data.get('end_time', ''),
-                data.get('business_name', ''),
-                data.get('district', ''),
-                data.get('physical_address', ''),
-                data.get('contact_person', ''),
-                data.get('email', ''),
-                data.get('phone', ''),
-                data.get('primary_sector', ''),
-                data.get('legal_status', ''),
-                data.get('business_size', ''),
-                data.get('ownership_structure', ''),
-                data.get('gender_owner', ''),
-                data.get('business_activities', ''),
-                json.dumps(isic_codes),
-                data.get('year_established', 0),
-                data.get('turnover_range', ''),
-                data.get('employees_fulltime', 0),
-                data.get('employees_parttime', 0),
-                procedure_data_json,
-                data.get('completion_time_local', 0.0),
-                data.get('completion_time_national', 0.0),
-                data.get('completion_time_dk', 0.0),
-                data.get('compliance_cost_percentage', 0.0),
-                data.get('permit_comparison_national', 0),
-                data.get('permit_comparison_local', 0),
-                data.get('cost_comparison_national', 0),
-                data.get('cost_comparison_local', 0),
-                data.get('business_climate_rating', 0),
-                json.dumps(reform_priorities),
-                'draft',
-                current_time,
-                current_time,
-                total_cost,
-                total_time,
-                risk_score,
-                st.session_state.current_user,
-                st.session_state.current_section,
-                progress
-            )
-            result = execute_query(insert_query, insert_data)
+        values.update({
+            'last_modified': current_time,
+            'created_by': st.session_state.current_user,
+            'current_section': st.session_state.current_section,
+            'draft_progress': progress
+        })
+        
+        # One upsert either way; status and submission_date are only set when the row is created
+        insert_columns = ['interview_id', *values, 'status', 'submission_date']
+        update_clause = ', '.join(f"{column}=excluded.{column}" for column in values)
+        upsert_query = (
+            f"INSERT INTO responses ({', '.join(insert_columns)}) "
+            f"VALUES ({', '.join('?' for _ in insert_columns)}) "
+            f"ON CONFLICT(interview_id) DO UPDATE SET {update_clause}"
+        )
+        result = execute_query(upsert_query, (interview_id, *values.values(), 'draft', current_time))
         
         if result:
+            bump_db_version()
             return interview_id
         return None
         
@@ -473,20 +676,22 @@ def save_draft(data, interview_id=None):
 def check_duplicate_business_name(business_name, current_interview_id=None):
     """Check if business name already exists"""
     try:
-        if current_interview_id:
-            result = execute_query("SELECT COUNT(*) FROM responses WHERE business_name = ? AND interview_id != ?", 
-                                 (business_name, current_interview_id), return_result=True)
-        else:
-            result = execute_query("SELECT COUNT(*) FROM responses WHERE business_name = ?", (business_name,), return_result=True)
+        current_interview_id = current_interview_id or None
+        result = execute_query(
+            DUPLICATE_BUSINESS_NAME_QUERY,
+            (business_name, current_interview_id, current_interview_id), return_result=True
+        )
         
-        if result and isinstance(result, tuple) and result[0]:
-            count = result[0][0][0] if result[0] else 0
-            return count > 0
-        return False
+        return bool(result and isinstance(result, tuple) and result[0])
     except Exception as e:
         st.error(f"Error checking duplicate business name: {str(e)}")
         return False
 
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_duplicate_business_name(business_name, current_interview_id, db_version):
+    """Cached duplicate business name check, refreshed when db_version changes"""
+    return check_duplicate_business_name(business_name, current_interview_id)
+
 def submit_final(interview_id):
     """Mark draft as final submission"""
     try:
@@ -496,10 +701,10 @@ def submit_final(interview_id):
             return False
         
         current_time = datetime.now().isoformat()
-        result = execute_query("UPDATE responses SET status = 'submitted', submission_date = ? WHERE interview_id = ?", 
-                              (current_time, interview_id))
+        result = execute_query(SUBMIT_INTERVIEW_QUERY, (current_time, interview_id))
         
         if result:
+            bump_db_version()
             log_admin_action(st.session_state.current_user, "interview_submitted", f"Interview {interview_id} submitted")
             return True
         return False
@@ -511,22 +716,42 @@ def generate_interview_id():
     """Generate unique interview ID"""
     return f"INT_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+EXPORT_CHUNK_SIZE = 10000
+
 def get_all_interviews():
     """Get all interviews from database"""
     try:
         if not check_and_fix_database():
             return pd.DataFrame()
             
-        query = """
-        SELECT 
-            interview_id, business_name, district, primary_sector, 
-            business_size, status, submission_date, last_modified,
-            total_compliance_cost, total_compliance_time, risk_score, created_by
-        FROM responses 
-        ORDER BY last_modified DESC
-        """
-        
-        result = execute_query(query, return_result=True)
+        result = execute_query(ALL_INTERVIEWS_QUERY, return_result=True)
+        if result and isinstance(result, tuple) and result[0]:
+            result_data, columns = result
+            df = pd.DataFrame(result_data, columns=columns)
+            return df
+        return pd.DataFrame()
+    except Exception as e:
+        st.error(f"Error loading interviews: {str(e)}")
+        return pd.DataFrame()
+
+def get_interview_count():
+    """Get total number of interviews"""
+    try:
+        result = execute_query("SELECT COUNT(*) FROM responses", return_result=True)
+        if result and isinstance(result, tuple) and result[0]:
+            return result[0][0][0]
+        return 0
+    except Exception as e:
+        st.error(f"Error counting interviews: {str(e)}")
+        return 0
+
+def get_interviews_page(offset, limit):
+    """Get one page of interview summaries, most recently modified first"""
+    try:
+        if not check_and_fix_database():
+            return pd.DataFrame()
+            
+        result = execute_query(INTERVIEWS_PAGE_QUERY, (limit, offset), return_result=True)
         if result and isinstance(result, tuple) and result[0]:
             result_data, columns = result
             df = pd.DataFrame(result_data, columns=columns)
@@ -542,33 +767,58 @@ def get_user_interviews(username):
         if not check_and_fix_database():
             return pd.DataFrame()
             
-        query = """
-        SELECT 
-            interview_id, business_name, district, primary_sector, 
-            business_size, status, submission_date, last_modified,
-            total_compliance_cost, total_compliance_time, risk_score
-        FROM responses 
-        WHERE created_by = ?
-        ORDER BY last_modified DESC
-        """
-        
-        result = execute_query(query, (username,), return_result=True)
+        result = execute_query(USER_INTERVIEWS_QUERY, (username,), return_result=True)
         if result and isinstance(result, tuple) and result[0]:
             result_data, columns = result
             df = pd.DataFrame(result_data, columns=columns)
+            df[INTERVIEW_CATEGORY_COLUMNS] = df[INTERVIEW_CATEGORY_COLUMNS].astype('category')
             return df
         return pd.DataFrame()
     except Exception as e:
         st.error(f"Error loading user interviews: {str(e)}")
         return pd.DataFrame()
 
-def get_interview_details(interview_id):
-    """Get detailed interview data"""
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_interview_count(db_version):
+    """Cached total number of interviews, refreshed when db_version changes"""
+    return get_interview_count()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_all_interviews(db_version):
+    """Cached list of all interviews, refreshed when db_version changes"""
+    return get_all_interviews()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_user_interviews(username, db_version):
+    """Cached user interviews, refreshed when db_version changes"""
+    return get_user_interviews(username)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def user_status_counts(username, db_version):
+    """Total, submitted and draft counts for a user's interviews"""
+    user_interviews = cached_user_interviews(username, db_version)
+    if user_interviews.empty:
+        return 0, 0, 0
+    status = user_interviews['status']
+    return (len(status),
+            int((status == 'submitted').sum()),
+            int((status == 'draft').sum()))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def user_csv_bytes(username, db_version):
+    """CSV export of a user's interviews, cached until db_version changes"""
+    output = io.BytesIO()
+    cached_user_interviews(username, db_version).to_csv(output, index=False, chunksize=10000)
+    return output.getvalue()
+
+def get_interview_details(interview_id, columns=None):
+    """Get detailed interview data, optionally limited to the given columns"""
     try:
         if not check_and_fix_database():
             return pd.DataFrame()
             
-        query = "SELECT * FROM responses WHERE interview_id = ?"
+        selected_columns = ', '.join(columns) if columns else '*'
+        query = f"SELECT {selected_columns} FROM responses WHERE interview_id = ? LIMIT 1"
         result = execute_query(query, (interview_id,), return_result=True)
         if result and isinstance(result, tuple) and result[0]:
             result_data, columns = result
@@ -579,7 +829,7 @@ def get_interview_details(interview_id):
         st.error(f"Error loading interview details: {str(e)}")
         return pd.DataFrame()
 
-def get_database_stats():
+def get_database_stats(current_user=None, user_role=None):
     """Get database statistics"""
     try:
         if not check_and_fix_database():
@@ -587,87 +837,78 @@ def get_database_stats():
             
         stats = {}
         
-        # Total interviews
-        result = execute_query("SELECT COUNT(*) as count FROM responses", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            stats['total_interviews'] = result[0][0][0] if result[0] else 0
-        
-        result = execute_query("SELECT COUNT(*) as count FROM responses WHERE status = 'submitted'", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            stats['submitted_interviews'] = result[0][0][0] if result[0] else 0
+        # Counts and averages are aggregated by SQLite, so only a handful of rows come back
+        result = execute_query(STATS_SUMMARY_QUERY, (current_user,), return_result=True)
+        if not (result and isinstance(result, tuple) and result[0]):
+            return {}
+        result_data, columns = result
+        summary = dict(zip(columns, result_data[0]))
         
-        result = execute_query("SELECT COUNT(*) as count FROM responses WHERE status = 'draft'", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            stats['draft_interviews'] = result[0][0][0] if result[0] else 0
+        stats['total_interviews'] = summary['total_interviews']
+        stats['submitted_interviews'] = summary['submitted_interviews']
+        stats['draft_interviews'] = summary['draft_interviews']
         
         # User-specific stats
-        if st.session_state.user_role == 'interviewer' and st.session_state.current_user:
-            result = execute_query("SELECT COUNT(*) as count FROM responses WHERE created_by = ?", (st.session_state.current_user,), return_result=True)
-            if result and isinstance(result, tuple) and result[0]:
-                stats['user_interviews'] = result[0][0][0] if result[0] else 0
-            else:
-                stats['user_interviews'] = 0
-        
-        # Sector distribution
-        result = execute_query("SELECT primary_sector, COUNT(*) as count FROM responses GROUP BY primary_sector", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            result_data, columns = result
-            stats['sector_dist'] = pd.DataFrame(result_data, columns=columns)
-        else:
-            stats['sector_dist'] = pd.DataFrame()
+        if user_role == 'interviewer' and current_user:
+            stats['user_interviews'] = summary['user_interviews']
         
-        # District distribution
-        result = execute_query("SELECT district, COUNT(*) as count FROM responses GROUP BY district", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            result_data, columns = result
-            stats['district_dist'] = pd.DataFrame(result_data, columns=columns)
-        else:
-            stats['district_dist'] = pd.DataFrame()
+        # Sector and district distribution
+        for key, query in (('sector_dist', SECTOR_DISTRIBUTION_QUERY), ('district_dist', DISTRICT_DISTRIBUTION_QUERY)):
+            result = execute_query(query, return_result=True)
+            if result and isinstance(result, tuple):
+                result_data, columns = result
+                stats[key] = pd.DataFrame(result_data, columns=columns)
+            else:
+                stats[key] = pd.DataFrame()
         
         # Average compliance metrics
-        result = execute_query("""
-            SELECT 
-                AVG(total_compliance_cost) as avg_cost,
-                AVG(total_compliance_time) as avg_time,
-                AVG(risk_score) as avg_risk
-            FROM responses 
-            WHERE status = 'submitted'
-        """, return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            result_data, columns = result
-            stats['avg_metrics'] = pd.DataFrame(result_data, columns=columns)
-        else:
-            stats['avg_metrics'] = pd.DataFrame()
+        stats['avg_metrics'] = pd.DataFrame([{key: summary[key] for key in ('avg_cost', 'avg_time', 'avg_risk')}])
         
         return stats
     except Exception as e:
         st.error(f"Error loading statistics: {str(e)}")
         return {}
 
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_database_stats(current_user, user_role, db_version):
+    """Cached database statistics for a user and role, refreshed when db_version changes"""
+    return get_database_stats(current_user, user_role)
+
 def log_admin_action(username, action, details=""):
-    """Log admin actions"""
-    try:
-        current_time = datetime.now().isoformat()
-        result = execute_query(
-            "INSERT INTO admin_logs (username, action, timestamp, details) VALUES (?, ?, ?, ?)",
-            (username, action, current_time, details)
-        )
-        return result is not None
-    except Exception as e:
-        st.error(f"Error logging admin action: {str(e)}")
-        return False
+    """Queue an admin action for the next batched log write"""
+    st.session_state.setdefault('admin_log_queue', []).append(
+        (username, action, datetime.now().isoformat(), details)
+    )
+    return True
 
 def log_user_session(username, login_time, logout_time=None, duration=None):
-    """Log user session information"""
+    """Queue user session information for the next batched log write"""
+    st.session_state.setdefault('session_log_queue', []).append(
+        (username, login_time, logout_time, duration)
+    )
+    return True
+
+def flush_log_queues():
+    """Write queued admin and session logs in one batch per table"""
     try:
-        result = execute_query(
-            "INSERT INTO user_sessions (username, login_time, logout_time, session_duration) VALUES (?, ?, ?, ?)",
-            (username, login_time, logout_time, duration)
-        )
-        return result is not None
+        admin_logs = st.session_state.get('admin_log_queue', [])
+        if admin_logs and execute_many(ADMIN_LOG_INSERT_QUERY, admin_logs):
+            st.session_state.admin_log_queue = []
+            st.session_state.log_version = st.session_state.get('log_version', 0) + 1
+            recent_log_rows.clear()
+        
+        session_logs = st.session_state.get('session_log_queue', [])
+        if session_logs and execute_many(SESSION_LOG_INSERT_QUERY, session_logs):
+            st.session_state.session_log_queue = []
+            st.session_state.log_version = st.session_state.get('log_version', 0) + 1
+            recent_log_rows.clear()
     except Exception as e:
-        st.error(f"Error logging user session: {str(e)}")
-        return False
+        st.error(f"Error writing logs: {str(e)}")
+
+@st.fragment(run_every="30s")
+def log_flush_timer():
+    """Periodically flush queued logs without rerunning the page"""
+    flush_log_queues()
 
 # Authentication System
 def login_system():
@@ -679,9 +920,9 @@ def login_system():
     
     with st.form("login_form"):
         if login_type == "Interviewer":
-            username = st.selectbox("Select Interviewer", list(INTERVIEWER_CREDENTIALS.keys()), key="interviewer_select")
+            username = st.selectbox("Select Interviewer", INTERVIEWERS, key="interviewer_select")
         else:
-            username = st.selectbox("Username", list(ADMIN_CREDENTIALS.keys()), key="admin_select")
+            username = st.selectbox("Username", ADMIN_USERS, key="admin_select")
         
         password = st.text_input("Password", type="password", key="login_password")
         
@@ -691,7 +932,7 @@ def login_system():
             else:
                 credentials = ADMIN_CREDENTIALS
             
-            if username in credentials and password == credentials[username]["password"]:
+            if username in credentials and hmac.compare_digest(PASSWORD_DIGESTS[username], password_digest(password)):
                 st.session_state.current_user = username
                 st.session_state.user_role = credentials[username]["role"]
                 
@@ -713,13 +954,10 @@ def login_system():
 def logout():
     """Logout function"""
     if st.session_state.current_user:
-        log_user_session(
-            st.session_state.current_user, 
-            datetime.now().isoformat(), 
-            datetime.now().isoformat(),
-            0
-        )
+        logout_time = datetime.now().isoformat()
+        log_user_session(st.session_state.current_user, logout_time, logout_time, 0)
         log_admin_action(st.session_state.current_user, "logout")
+        flush_log_queues()
     
     # Reset session states
     for key in list(st.session_state.keys()):
@@ -737,7 +975,7 @@ def test_connection():
         if conn:
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
-            result = cursor.fetchone()
+            cursor.fetchone()
             conn.close()
             st.success("✅ Successfully connected to SQLite Cloud!")
             return True
@@ -747,6 +985,7 @@ def test_connection():
         return False
 
 # Section A - Business Profile
+@st.fragment
 def display_section_a():
     """Section A: Interview & Business Profile"""
     st.header("📋 SECTION A: Interview & Business Profile")
@@ -756,101 +995,70 @@ def display_section_a():
         
         col1, col2 = st.columns(2)
         with col1:
-            interviewer = st.selectbox("Interviewer's Name", INTERVIEWERS, key="interviewer_name")
-            interview_date = st.date_input("Date of Interview", key="interview_date")
+            st.selectbox("Interviewer's Name", INTERVIEWERS, key="interviewer_name")
+            st.date_input("Date of Interview", key="interview_date")
         with col2:
-            start_time = st.time_input("Start Time", value=datetime.now().time(), key="start_time")
-            end_time = st.time_input("End Time", value=datetime.now().time(), key="end_time")
+            st.time_input("Start Time", value=datetime.now().time(), key="start_time")
+            st.time_input("End Time", value=datetime.now().time(), key="end_time")
         
         st.subheader("A2. Business Identification")
         col1, col2 = st.columns(2)
         with col1:
             business_name = st.text_input("Business Name *", key="business_name")
             if business_name and st.session_state.current_interview_id:
-                if check_duplicate_business_name(business_name, st.session_state.current_interview_id):
+                if cached_duplicate_business_name(business_name, st.session_state.current_interview_id, st.session_state.db_version):
                     st.error(f"⚠️ Business name '{business_name}' already exists. Please use a unique name.")
             
-            district = st.selectbox("Location (Town/District) *", DISTRICTS, key="district")
-            physical_address = st.text_area("Physical Address", key="physical_address")
+            st.selectbox("Location (Town/District) *", DISTRICTS, key="district")
+            st.text_area("Physical Address", key="physical_address")
         with col2:
-            contact_person = st.text_input("Contact Person & Title *", key="contact_person")
-            email = st.text_input("Email Address", key="email")
-            phone = st.text_input("Phone Number", key="phone")
+            st.text_input("Contact Person & Title *", key="contact_person")
+            st.text_input("Email Address", key="email")
+            st.text_input("Phone Number", key="phone")
         
         st.subheader("A3. Business Classification")
         col1, col2 = st.columns(2)
         with col1:
-            primary_sector = st.radio("Primary Sector *", ["Agribusiness", "Construction"], key="primary_sector")
-            legal_status = st.selectbox("Legal Status *", 
-                                      ["Sole Proprietor", "Partnership", "Limited Liability Company", 
-                                       "Public Limited Company", "Other"],
-                                      key="legal_status")
+            st.radio("Primary Sector *", SECTORS, key="primary_sector")
+            st.selectbox("Legal Status *", LEGAL_STATUSES, key="legal_status")
         with col2:
-            business_size = st.selectbox("Business Size *", 
-                                       ["Micro (1-9)", "Small (10-49)", "Medium (50-249)", "Large (250+)"],
-                                       key="business_size")
-            ownership = st.selectbox("Ownership Structure *",
-                                  ["100% Zambian-owned", "Partially Foreign-owned", 
-                                   "Majority/Fully Foreign-owned", "Other"],
-                                  key="ownership")
-            gender_owner = st.radio("Gender of Majority Owner/CEO *", ["Male", "Female", "Joint (M/F)"], key="gender_owner")
+            st.selectbox("Business Size *", BUSINESS_SIZES, key="business_size")
+            st.selectbox("Ownership Structure *", OWNERSHIP_STRUCTURES, key="ownership")
+            st.radio("Gender of Majority Owner/CEO *", OWNER_GENDERS, key="gender_owner")
         
         st.subheader("A4. Business Background")
         
-        business_activities = st.text_area(
+        st.text_area(
             "Business Activities Description *",
-            value=st.session_state.business_activities_text,
             placeholder="Describe your main business activities, products, and services in detail...",
             height=120,
             key="business_activities_form"
         )
-        st.session_state.business_activities_text = business_activities
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            year_established = st.number_input("Year of Establishment", min_value=1900, max_value=2024, value=2020, key="year_established")
+            st.number_input("Year of Establishment", min_value=1900, max_value=2024, value=2020, key="year_established")
         with col2:
-            turnover_range = st.selectbox("Annual Turnover Range", 
-                                        ["< 500,000", "500,000 - 1M", "1M - 5M", "5M - 10M", "10M - 50M", "> 50M"],
-                                        key="turnover_range")
+            st.selectbox("Annual Turnover Range", TURNOVER_RANGES, key="turnover_range")
         with col3:
-            employees_fulltime = st.number_input("Full-time Employees", min_value=0, value=0, key="employees_fulltime")
-            employees_parttime = st.number_input("Part-time Employees", min_value=0, value=0, key="employees_parttime")
+            st.number_input("Full-time Employees", min_value=0, value=0, key="employees_fulltime")
+            st.number_input("Part-time Employees", min_value=0, value=0, key="employees_parttime")
         
         if st.form_submit_button("💾 Save Section A", use_container_width=True):
             if not business_name:
                 st.error("❌ Business Name is required!")
                 return
                 
-            if check_duplicate_business_name(business_name, st.session_state.current_interview_id):
+            if cached_duplicate_business_name(business_name, st.session_state.current_interview_id, st.session_state.db_version):
                 st.error(f"❌ Business name '{business_name}' already exists. Please use a unique name.")
                 return
             
-            st.session_state.form_data.update({
-                'interviewer_name': interviewer,
-                'interview_date': str(interview_date),
-                'start_time': str(start_time),
-                'end_time': str(end_time),
-                'business_name': business_name,
-                'district': district,
-                'physical_address': physical_address,
-                'contact_person': contact_person,
-                'email': email,
-                'phone': phone,
-                'primary_sector': primary_sector,
-                'legal_status': legal_status,
-                'business_size': business_size,
-                'ownership_structure': ownership,
-                'gender_owner': gender_owner,
-                'business_activities': business_activities,
-                'isic_codes': st.session_state.selected_isic_codes,
-                'year_established': year_established,
-                'turnover_range': turnover_range,
-                'employees_fulltime': employees_fulltime,
-                'employees_parttime': employees_parttime
-            })
+            st.session_state.form_data.update(collect_form_fields(SECTION_A_FIELDS))
+            # The description box below the form has not rendered yet this run, so it can be updated
+            st.session_state.business_activities_desc = st.session_state.business_activities_form
+            st.session_state.form_data['isic_codes'] = st.session_state.selected_isic_codes
             
-            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id)
+            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id, SECTION_A_COLUMNS)
             if interview_id:
                 st.session_state.current_interview_id = interview_id
                 st.success("✅ Section A saved successfully!")
@@ -859,6 +1067,10 @@ def display_section_a():
     st.markdown("---")
     business_activities_section()
 
+def sync_business_activities():
+    """Carry the description typed below the form into the Section A form field"""
+    st.session_state.business_activities_form = st.session_state.business_activities_desc
+
 def business_activities_section():
     """Business activities section with ISIC integration"""
     st.subheader("🏢 Business Activities & ISIC Classification")
@@ -869,12 +1081,11 @@ def business_activities_section():
         st.write("**Describe your main business activities:**")
         business_activities = st.text_area(
             "Business Activities Description *",
-            value=st.session_state.business_activities_text,
             placeholder="Describe your main business activities, products, and services in detail...",
             height=120,
-            key="business_activities_desc"
+            key="business_activities_desc",
+            on_change=sync_business_activities
         )
-        st.session_state.business_activities_text = business_activities
     
     with col2:
         st.write("**💡 Tips:**")
@@ -899,18 +1110,26 @@ def business_activities_section():
     if st.session_state.selected_isic_codes:
         st.subheader("✅ Selected ISIC Codes")
         
-        for i, code in enumerate(st.session_state.selected_isic_codes):
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                st.write(f"• {code}")
-            with col2:
-                if st.button("🗑️", key=f"remove_isic_{i}"):
-                    st.session_state.selected_isic_codes.pop(i)
-                    st.rerun()
+        # One table with row selection instead of a row of columns and a button per code
+        selection = st.dataframe(
+            pd.DataFrame({'ISIC Code': st.session_state.selected_isic_codes}),
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="multi-row",
+            key="selected_isic_table"
+        )
+        selected_rows = set(selection.selection.rows)
+        if selected_rows and st.button("🗑️ Remove Selected", key="remove_isic_selected"):
+            st.session_state.selected_isic_codes[:] = [
+                code for i, code in enumerate(st.session_state.selected_isic_codes) if i not in selected_rows
+            ]
+            rerun_fragment()
     
     return business_activities
 
 # Section B - Registration & Licensing
+@st.fragment
 def enhanced_section_b():
     """Enhanced Section B with multiple entry modes"""
     st.header("📑 SECTION B: REGISTRATION & LICENSING LANDSCAPE")
@@ -958,7 +1177,7 @@ def enhanced_section_b():
     with save_col1:
         if st.button("💾 Save Procedures", use_container_width=True, key="save_procedures_main"):
             st.session_state.form_data['procedure_data'] = st.session_state.procedures_list
-            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id)
+            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id, ['procedure_data'])
             if interview_id:
                 st.session_state.current_interview_id = interview_id
                 st.success(f"✅ Saved {len(st.session_state.procedures_list)} procedures!")
@@ -972,10 +1191,77 @@ def enhanced_section_b():
             if st.session_state.procedures_list:
                 if st.checkbox("Confirm reset all procedures in this section"):
                     st.session_state.procedures_list = []
+                    sync_procedures_df()
                     st.rerun()
             else:
                 st.info("No procedures to reset")
 
+def sync_procedures_df():
+    """Rebuild the columnar mirror of procedures_list after a change"""
+    st.session_state.procedures_df = pd.DataFrame(st.session_state.procedures_list)
+
+def get_procedures_df():
+    """Get the columnar mirror of procedures_list"""
+    procedures_df = st.session_state.get('procedures_df')
+    if procedures_df is None or len(procedures_df) != len(st.session_state.procedures_list):
+        sync_procedures_df()
+    return st.session_state.procedures_df
+
+def procedures_summary(procedures_df, cost_columns=('official_fees', 'unofficial_payments')):
+    """Aggregate count, cost, time and complexity over the procedures DataFrame"""
+    present_cost_columns = [column for column in cost_columns if column in procedures_df.columns]
+    return {
+        'total_procedures': len(procedures_df),
+        'total_cost': procedures_df[present_cost_columns].fillna(0).to_numpy().sum(),
+        'total_time': procedures_df['total_days'].sum(),
+        'avg_complexity': procedures_df['complexity'].mean()
+    }
+
+def session_procedures_summary(cost_columns=('official_fees', 'unofficial_payments')):
+    """procedures_summary of the session procedures, reused until the procedures DataFrame is rebuilt"""
+    procedures_df = get_procedures_df()
+    cache = st.session_state.get('procedures_summary_cache')
+    if cache is None or cache[0] is not procedures_df:
+        cache = (procedures_df, {})
+        st.session_state.procedures_summary_cache = cache
+    
+    summaries = cache[1]
+    if cost_columns not in summaries:
+        summaries[cost_columns] = procedures_summary(procedures_df, cost_columns)
+    return summaries[cost_columns]
+
+def calculate_procedure_risk(procedure):
+    """Calculate risk score for a single procedure"""
+    cost = procedure.get('official_fees', 0) + procedure.get('unofficial_payments', 0)
+    return (procedure.get('complexity', 3) * 2 + min(cost / 5000, 10) + min(procedure.get('total_days', 0) / 30, 10)) / 3
+
+def build_procedure(name, authority, total_days, official_fees, complexity, renewable, renewal_frequency,
+                    status='Completed', application_mode='Mixed', documents=(), follow_ups=2, prep_share=3):
+    """Build a template-style procedure record, splitting total days into preparation and waiting"""
+    prep_split = total_days // prep_share
+    procedure = {
+        'procedure': name,
+        'authority': authority,
+        'status': status,
+        'prep_days': max(1, prep_split),
+        'wait_days': max(1, total_days - prep_split),
+        'total_days': total_days,
+        'official_fees': official_fees,
+        'unofficial_payments': 0.0,
+        'travel_costs': 0.0,
+        'external_support': 'No',
+        'external_cost': 0.0,
+        'complexity': complexity,
+        'renewable': renewable,
+        'renewal_frequency': renewal_frequency,
+        'application_mode': application_mode,
+        'documents': list(documents),
+        'challenges': '',
+        'follow_ups': follow_ups
+    }
+    procedure['risk_score'] = calculate_procedure_risk(procedure)
+    return procedure
+
 def quick_manual_procedure():
     """Quick manual procedure entry"""
     st.subheader("⚡ Quick Manual Entry")
@@ -1034,30 +1320,14 @@ def quick_manual_procedure():
         
         if st.form_submit_button("🚀 Add Procedure (Quick)", use_container_width=True):
             if quick_procedure and quick_authority:
-                procedure_data = {
-                    'procedure': quick_procedure,
-                    'authority': quick_authority,
-                    'status': quick_status,
-                    'prep_days': max(1, quick_days // 3),
-                    'wait_days': max(1, quick_days - (quick_days // 3)),
-                    'total_days': quick_days,
-                    'official_fees': quick_cost,
-                    'unofficial_payments': 0.0,
-                    'travel_costs': 0.0,
-                    'external_support': 'No',
-                    'external_cost': 0.0,
-                    'complexity': complexity_map[complexity_help],
-                    'renewable': 'Yes',
-                    'renewal_frequency': 'Annual',
-                    'application_mode': quick_mode,
-                    'documents': [],
-                    'challenges': '',
-                    'follow_ups': 2
-                }
-                
+                procedure_data = build_procedure(
+                    quick_procedure, quick_authority, quick_days, quick_cost, complexity_map[complexity_help],
+                    'Yes', 'Annual', status=quick_status, application_mode=quick_mode
+                )
                 st.session_state.procedures_list.append(procedure_data)
+                sync_procedures_df()
                 st.success(f"✅ Added: {quick_procedure}")
-                st.rerun()
+                rerun_fragment()
             else:
                 st.error("Please fill in Procedure Name and Regulatory Body")
 
@@ -1077,9 +1347,7 @@ def single_procedure_capture():
                                                key="authority_single")
         
         with col2:
-            current_status = st.selectbox("Current Status", 
-                                        ["Not Started", "In Progress", "Completed", "Delayed", "Rejected"],
-                                        key="status_single")
+            current_status = st.selectbox("Current Status", PROCEDURE_STATUSES, key="status_single")
             application_mode = st.selectbox("Mode of Application *", APPLICATION_MODES, key="app_mode_single")
         
         st.write("⏱️ Time Analysis")
@@ -1168,13 +1436,14 @@ def single_procedure_capture():
         
         st.write("📄 Requirements & Challenges")
         
-        num_documents = st.number_input("Number of Required Documents", min_value=0, max_value=15, value=0,
-                                      key="num_docs_single")
-        documents = []
-        for i in range(num_documents):
-            doc = st.text_input(f"Document {i+1}", placeholder=f"Document name {i+1}", key=f"doc_single_{i}")
-            if doc:
-                documents.append(doc)
+        documents_table = st.data_editor(
+            pd.DataFrame({'Document': pd.Series(dtype='str')}),
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            key="docs_single"
+        )
+        documents = [doc.strip() for doc in documents_table['Document'].dropna() if doc.strip()]
         
         challenges = st.text_area("Challenges & Observations", 
                                 placeholder="Describe any difficulties, delays, or observations...",
@@ -1205,9 +1474,11 @@ def single_procedure_capture():
                     'challenges': challenges
                 }
                 
+                procedure_data['risk_score'] = calculate_procedure_risk(procedure_data)
                 st.session_state.procedures_list.append(procedure_data)
+                sync_procedures_df()
                 st.success(f"✅ Added: {procedure_name}")
-                st.rerun()
+                rerun_fragment()
             else:
                 st.error("Please fill in required fields (Procedure Name and Regulatory Body)")
 
@@ -1217,48 +1488,16 @@ def enhanced_bulk_procedures_capture():
     
     sector = st.session_state.form_data.get('primary_sector', 'Agribusiness')
     
-    expanded_licenses = {
-        "Agribusiness": {
-            "PACRA Business Registration": {
-                "authority": "PACRA", "renewable": "No", "renewal_frequency": "One-time",
-                "common_documents": ["Application form", "Business name reservation", "Identification documents"],
-                "typical_cost": 1000, "typical_days": 14, "complexity": 3
-            },
-            "ZRA Tax Registration": {
-                "authority": "ZRA", "renewable": "No", "renewal_frequency": "One-time", 
-                "common_documents": ["PACRA certificate", "Business registration", "Owner identification"],
-                "typical_cost": 0, "typical_days": 7, "complexity": 2
-            },
-            "Local Trading License": {
-                "authority": "Local Council", "renewable": "Yes", "renewal_frequency": "Annual",
-                "common_documents": ["Application form", "Business premises details", "Health certificate"],
-                "typical_cost": 1500, "typical_days": 21, "complexity": 4
-            }
-        },
-        "Construction": {
-            "NCC Registration": {
-                "authority": "NCC", "renewable": "Yes", "renewal_frequency": "Annual",
-                "common_documents": ["Company registration", "Technical staff certificates", "Equipment list"],
-                "typical_cost": 5000, "typical_days": 30, "complexity": 7
-            },
-            "Building Permit": {
-                "authority": "Local Council", "renewable": "No", "renewal_frequency": "Project-based",
-                "common_documents": ["Architectural drawings", "Structural designs", "Site plans"],
-                "typical_cost": 2500, "typical_days": 45, "complexity": 6
-            }
-        }
-    }
-    
     st.write("**🚀 Quick Actions**")
     quick_col1, quick_col2, quick_col3, quick_col4 = st.columns(4)
     
     with quick_col1:
         if st.button("🏗️ All Construction", use_container_width=True, key="all_constr_btn"):
-            add_all_sector_templates("Construction", expanded_licenses)
+            add_all_sector_templates("Construction", EXPANDED_LICENSES)
     
     with quick_col2:
         if st.button("🌾 All Agribusiness", use_container_width=True, key="all_agri_btn"):
-            add_all_sector_templates("Agribusiness", expanded_licenses)
+            add_all_sector_templates("Agribusiness", EXPANDED_LICENSES)
     
     with quick_col3:
         if st.button("🏛️ Common National", use_container_width=True, key="common_national_btn"):
@@ -1267,17 +1506,28 @@ def enhanced_bulk_procedures_capture():
     with quick_col4:
         if st.button("🗑️ Clear All", use_container_width=True, key="clear_all_btn"):
             st.session_state.procedures_list = []
-            st.rerun()
+            sync_procedures_df()
+            rerun_fragment()
     
     with st.form("enhanced_bulk_form"):
         st.write("**📋 Bulk License Selection**")
         
-        sector_licenses = expanded_licenses.get(sector, {})
-        selected_licenses = []
+        sector_licenses = EXPANDED_LICENSES.get(sector, {})
         
-        for license_name, license_data in sector_licenses.items():
-            if st.checkbox(f"{license_name} ({license_data['authority']})", key=f"bulk_{license_name}"):
-                selected_licenses.append((license_name, license_data))
+        # One editable table instead of a checkbox per license
+        license_table = st.data_editor(
+            pd.DataFrame({
+                'Add': False,
+                'License': list(sector_licenses),
+                'Authority': [license_data['authority'] for license_data in sector_licenses.values()]
+            }),
+            use_container_width=True,
+            hide_index=True,
+            disabled=['License', 'Authority'],
+            key=f"bulk_licenses_{sector[:2]}"
+        )
+        selected_licenses = [(license_name, sector_licenses[license_name])
+                             for license_name in license_table.loc[license_table['Add'], 'License']]
         
         if selected_licenses:
             st.write("**⚙️ Bulk Configuration**")
@@ -1292,9 +1542,13 @@ def enhanced_bulk_procedures_capture():
                 time_adjust = st.number_input("Time Adjustment (%)", min_value=-50, max_value=200, value=0, key="time_adj")
         
         if st.form_submit_button("📥 Add Selected Licenses", use_container_width=True):
-            added_count = 0
+            new_procedures = []
+            existing_names = {p['procedure'] for p in st.session_state.procedures_list}
             for license_name, license_data in selected_licenses:
-                template_data = expanded_licenses[sector][license_name]
+                if license_name in existing_names:
+                    continue
+                
+                template_data = EXPANDED_LICENSES[sector][license_name]
                 
                 base_cost = template_data.get('typical_cost', 0)
                 adjusted_cost = base_cost * (1 + cost_adjust / 100)
@@ -1302,67 +1556,37 @@ def enhanced_bulk_procedures_capture():
                 base_days = template_data.get('typical_days', 30)
                 adjusted_days = max(1, int(base_days * (1 + time_adjust / 100)))
                 
-                procedure = {
-                    'procedure': license_name,
-                    'authority': license_data['authority'],
-                    'status': bulk_status,
-                    'prep_days': max(1, adjusted_days // 3),
-                    'wait_days': max(1, adjusted_days - (adjusted_days // 3)),
-                    'total_days': adjusted_days,
-                    'official_fees': adjusted_cost,
-                    'unofficial_payments': 0.0,
-                    'travel_costs': 0.0,
-                    'external_support': 'No',
-                    'external_cost': 0.0,
-                    'complexity': template_data.get('complexity', 3),
-                    'renewable': license_data['renewable'],
-                    'renewal_frequency': license_data['renewal_frequency'],
-                    'application_mode': bulk_mode,
-                    'documents': template_data['common_documents'],
-                    'challenges': '',
-                    'follow_ups': 2
-                }
-                
-                existing_names = [p['procedure'] for p in st.session_state.procedures_list]
-                if license_name not in existing_names:
-                    st.session_state.procedures_list.append(procedure)
-                    added_count += 1
+                new_procedures.append(build_procedure(
+                    license_name, license_data['authority'], adjusted_days, adjusted_cost,
+                    template_data.get('complexity', 3), license_data['renewable'], license_data['renewal_frequency'],
+                    status=bulk_status, application_mode=bulk_mode, documents=template_data['common_documents']
+                ))
+                existing_names.add(license_name)
             
-            st.success(f"✅ Added {added_count} procedures!")
-            st.rerun()
+            st.session_state.procedures_list.extend(new_procedures)
+            sync_procedures_df()
+            st.success(f"✅ Added {len(new_procedures)} procedures!")
+            rerun_fragment()
 
 def add_all_sector_templates(sector, licenses_data):
     """Add all templates for a sector"""
     if sector in licenses_data:
-        added_count = 0
-        for license_name, license_data in licenses_data[sector].items():
-            existing_names = [p['procedure'] for p in st.session_state.procedures_list]
-            if license_name not in existing_names:
-                procedure = {
-                    'procedure': license_name,
-                    'authority': license_data['authority'],
-                    'status': 'Completed',
-                    'prep_days': max(1, license_data.get('typical_days', 30) // 3),
-                    'wait_days': max(1, license_data.get('typical_days', 30) - (license_data.get('typical_days', 30) // 3)),
-                    'total_days': license_data.get('typical_days', 30),
-                    'official_fees': license_data.get('typical_cost', 0),
-                    'unofficial_payments': 0.0,
-                    'travel_costs': 0.0,
-                    'external_support': 'No',
-                    'external_cost': 0.0,
-                    'complexity': license_data.get('complexity', 3),
-                    'renewable': license_data['renewable'],
-                    'renewal_frequency': license_data['renewal_frequency'],
-                    'application_mode': 'Mixed',
-                    'documents': license_data['common_documents'],
-                    'challenges': '',
-                    'follow_ups': 2
-                }
-                st.session_state.procedures_list.append(procedure)
-                added_count += 1
+        existing_names = {p['procedure'] for p in st.session_state.procedures_list}
+        new_procedures = [
+            build_procedure(
+                license_name, license_data['authority'], license_data.get('typical_days', 30),
+                license_data.get('typical_cost', 0), license_data.get('complexity', 3),
+                license_data['renewable'], license_data['renewal_frequency'],
+                documents=license_data['common_documents']
+            )
+            for license_name, license_data in licenses_data[sector].items()
+            if license_name not in existing_names
+        ]
+        st.session_state.procedures_list.extend(new_procedures)
         
-        st.success(f"✅ Added {added_count} {sector} procedures!")
-        st.rerun()
+        sync_procedures_df()
+        st.success(f"✅ Added {len(new_procedures)} {sector} procedures!")
+        rerun_fragment()
 
 def add_common_national_licenses(sector):
     """Add common national licenses across sectors"""
@@ -1375,35 +1599,21 @@ def add_common_national_licenses(sector):
         }
     }
     
-    added_count = 0
-    for license_name, license_data in common_national.items():
-        existing_names = [p['procedure'] for p in st.session_state.procedures_list]
-        if license_name not in existing_names:
-            procedure = {
-                'procedure': license_name,
-                'authority': license_data['authority'],
-                'status': 'Completed',
-                'prep_days': max(1, license_data.get('typical_days', 14) // 2),
-                'wait_days': max(1, license_data.get('typical_days', 14) - (license_data.get('typical_days', 14) // 2)),
-                'total_days': license_data.get('typical_days', 14),
-                'official_fees': license_data.get('typical_cost', 0),
-                'unofficial_payments': 0.0,
-                'travel_costs': 0.0,
-                'external_support': 'No',
-                'external_cost': 0.0,
-                'complexity': license_data.get('complexity', 3),
-                'renewable': license_data['renewable'],
-                'renewal_frequency': 'One-time',
-                'application_mode': 'Mixed',
-                'documents': [],
-                'challenges': '',
-                'follow_ups': 1
-            }
-            st.session_state.procedures_list.append(procedure)
-            added_count += 1
-    
-    st.success(f"✅ Added {added_count} common national licenses!")
-    st.rerun()
+    existing_names = {p['procedure'] for p in st.session_state.procedures_list}
+    new_procedures = [
+        build_procedure(
+            license_name, license_data['authority'], license_data.get('typical_days', 14),
+            license_data.get('typical_cost', 0), license_data.get('complexity', 3),
+            license_data['renewable'], 'One-time', follow_ups=1, prep_share=2
+        )
+        for license_name, license_data in common_national.items()
+        if license_name not in existing_names
+    ]
+    st.session_state.procedures_list.extend(new_procedures)
+    
+    sync_procedures_df()
+    st.success(f"✅ Added {len(new_procedures)} common national licenses!")
+    rerun_fragment()
 
 def interactive_procedures_manager():
     """Manage procedures with enhanced editing"""
@@ -1413,93 +1623,128 @@ def interactive_procedures_manager():
     
     st.subheader("📋 Procedures Management")
     
-    total_procedures = len(st.session_state.procedures_list)
-    total_cost = sum(p['official_fees'] + p.get('unofficial_payments', 0) + p.get('travel_costs', 0) for p in st.session_state.procedures_list)
-    total_time = sum(p['total_days'] for p in st.session_state.procedures_list)
-    avg_complexity = sum(p['complexity'] for p in st.session_state.procedures_list) / total_procedures
+    summary = session_procedures_summary(('official_fees', 'unofficial_payments', 'travel_costs'))
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Procedures", total_procedures)
+        st.metric("Total Procedures", summary['total_procedures'])
     with col2:
-        st.metric("Total Cost", f"ZMW {total_cost:,.0f}")
+        st.metric("Total Cost", f"ZMW {summary['total_cost']:,.0f}")
     with col3:
-        st.metric("Total Time", f"{total_time} days")
+        st.metric("Total Time", f"{summary['total_time']} days")
     with col4:
-        st.metric("Avg Complexity", f"{avg_complexity:.1f}/5")
+        st.metric("Avg Complexity", f"{summary['avg_complexity']:.1f}/5")
+    
+    # One table for all procedures; only the selected row gets the detail and edit widgets
+    procedures_df = get_procedures_df()
+    table_columns = [column for column in PROCEDURE_TABLE_COLUMNS if column in procedures_df.columns]
+    selection = st.dataframe(
+        procedures_df[table_columns],
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        column_config={
+            'procedure': st.column_config.TextColumn("Procedure"),
+            'authority': st.column_config.TextColumn("Authority"),
+            'status': st.column_config.TextColumn("Status"),
+            'application_mode': st.column_config.TextColumn("Application Mode"),
+            'complexity': st.column_config.NumberColumn("Complexity", format="%d/5"),
+            'total_days': st.column_config.NumberColumn("Total Days"),
+            'official_fees': st.column_config.NumberColumn("Official Fees (ZMW)", format="%.0f"),
+            'unofficial_payments': st.column_config.NumberColumn("Unofficial (ZMW)", format="%.0f")
+        },
+        key="procedures_table"
+    )
     
-    for i, procedure in enumerate(st.session_state.procedures_list):
-        with st.container():
-            st.markdown(f"**{i+1}. {procedure['procedure']}** - {procedure['authority']} ({procedure['status']})")
+    selected_rows = [row for row in selection.selection.rows if row < len(st.session_state.procedures_list)]
+    if selected_rows:
+        display_procedure_details(selected_rows[0])
+    else:
+        st.caption("Select a procedure in the table to view, edit or delete it.")
+
+@st.fragment
+def display_procedure_details(index):
+    """Display one procedure with its edit and delete actions, rerunning only this row"""
+    procedure = st.session_state.procedures_list[index]
+    
+    with st.container():
+        st.markdown(f"**{index+1}. {procedure['procedure']}** - {procedure['authority']} ({procedure['status']})")
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            info_col1, info_col2, info_col3 = st.columns(3)
             
-            col1, col2 = st.columns([3, 1])
+            # One markdown element per column, with explicit line breaks between fields
+            info_col1.markdown(
+                f"**Status:** {procedure['status']}  \n"
+                f"**Complexity:** {procedure['complexity']}/5  \n"
+                f"**Application Mode:** {procedure['application_mode']}"
+            )
+            info_col2.markdown(
+                f"**Prep Time:** {procedure['prep_days']} days  \n"
+                f"**Wait Time:** {procedure['wait_days']} days  \n"
+                f"**Total Time:** {procedure['total_days']} days"
+            )
+            
+            fees_md = f"**Official Fees:** ZMW {procedure['official_fees']:,.0f}"
+            if procedure.get('unofficial_payments', 0) > 0:
+                fees_md += f"  \n**Unofficial:** ZMW {procedure['unofficial_payments']:,.0f}"
+            info_col3.markdown(fees_md)
+        
+        with col2:
+            if st.button("✏️ Edit", key=f"edit_proc_{index}"):
+                st.session_state.active_procedure_index = index
             
-            with col1:
-                info_col1, info_col2, info_col3 = st.columns(3)
+            if st.button("🗑️ Delete", key=f"delete_proc_{index}"):
+                st.session_state.procedures_list.pop(index)
+                sync_procedures_df()
+                # Row numbers and totals change, so the whole page reruns
+                st.rerun()
+        
+        if st.session_state.get('active_procedure_index') == index:
+            with st.form(f"edit_procedure_{index}"):
+                st.write("**Edit Procedure**")
                 
-                with info_col1:
-                    st.write(f"**Status:** {procedure['status']}")
-                    st.write(f"**Complexity:** {procedure['complexity']}/5")
-                    st.write(f"**Application Mode:** {procedure['application_mode']}")
+                edit_col1, edit_col2 = st.columns(2)
+                with edit_col1:
+                    new_status = st.selectbox("Status", PROCEDURE_STATUSES, 
+                                            index=PROCEDURE_STATUSES.index(procedure['status']),
+                                            key=f"edit_status_{index}")
+                    new_complexity = st.slider("Complexity", 1, 5, procedure['complexity'],
+                                             key=f"edit_complexity_{index}")
+                with edit_col2:
+                    new_official_fees = st.number_input("Official Fees", min_value=0.0, value=float(procedure['official_fees']),
+                                                      key=f"edit_fees_{index}")
+                    new_unofficial = st.number_input("Unofficial Payments", min_value=0.0, value=float(procedure.get('unofficial_payments', 0.0)),
+                                                   key=f"edit_unofficial_{index}")
                 
-                with info_col2:
-                    st.write(f"**Prep Time:** {procedure['prep_days']} days")
-                    st.write(f"**Wait Time:** {procedure['wait_days']} days")
-                    st.write(f"**Total Time:** {procedure['total_days']} days")
+                new_application_mode = st.selectbox("Application Mode", APPLICATION_MODES, 
+                                                  index=APPLICATION_MODES.index(procedure['application_mode']) if procedure['application_mode'] in APPLICATION_MODES else 0,
+                                                  key=f"edit_app_mode_{index}")
                 
-                with info_col3:
-                    st.write(f"**Official Fees:** ZMW {procedure['official_fees']:,.0f}")
-                    if procedure.get('unofficial_payments', 0) > 0:
-                        st.write(f"**Unofficial:** ZMW {procedure['unofficial_payments']:,.0f}")
-            
-            with col2:
-                if st.button("✏️ Edit", key=f"edit_proc_{i}"):
-                    st.session_state.active_procedure_index = i
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.form_submit_button("💾 Save Changes", use_container_width=True):
+                        st.session_state.procedures_list[index].update({
+                            'status': new_status,
+                            'complexity': new_complexity,
+                            'official_fees': new_official_fees,
+                            'unofficial_payments': new_unofficial,
+                            'application_mode': new_application_mode
+                        })
+                        st.session_state.procedures_list[index]['risk_score'] = calculate_procedure_risk(st.session_state.procedures_list[index])
+                        sync_procedures_df()
+                        st.session_state.active_procedure_index = None
+                        st.rerun()
                 
-                if st.button("🗑️ Delete", key=f"delete_proc_{i}"):
-                    st.session_state.procedures_list.pop(i)
-                    st.rerun()
-            
-            if st.session_state.get('active_procedure_index') == i:
-                with st.form(f"edit_procedure_{i}"):
-                    st.write("**Edit Procedure**")
-                    
-                    edit_col1, edit_col2 = st.columns(2)
-                    with edit_col1:
-                        new_status = st.selectbox("Status", ["Not Started", "In Progress", "Completed", "Delayed", "Rejected"], 
-                                                index=["Not Started", "In Progress", "Completed", "Delayed", "Rejected"].index(procedure['status']),
-                                                key=f"edit_status_{i}")
-                        new_complexity = st.slider("Complexity", 1, 5, procedure['complexity'],
-                                                 key=f"edit_complexity_{i}")
-                    with edit_col2:
-                        new_official_fees = st.number_input("Official Fees", min_value=0.0, value=procedure['official_fees'],
-                                                          key=f"edit_fees_{i}")
-                        new_unofficial = st.number_input("Unofficial Payments", min_value=0.0, value=procedure.get('unofficial_payments', 0.0),
-                                                       key=f"edit_unofficial_{i}")
-                    
-                    new_application_mode = st.selectbox("Application Mode", APPLICATION_MODES, 
-                                                      index=APPLICATION_MODES.index(procedure['application_mode']) if procedure['application_mode'] in APPLICATION_MODES else 0,
-                                                      key=f"edit_app_mode_{i}")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.form_submit_button("💾 Save Changes", use_container_width=True):
-                            st.session_state.procedures_list[i].update({
-                                'status': new_status,
-                                'complexity': new_complexity,
-                                'official_fees': new_official_fees,
-                                'unofficial_payments': new_unofficial,
-                                'application_mode': new_application_mode
-                            })
-                            st.session_state.active_procedure_index = None
-                            st.rerun()
-                    
-                    with col2:
-                        if st.form_submit_button("❌ Cancel", use_container_width=True):
-                            st.session_state.active_procedure_index = None
-                            st.rerun()
-            
-            st.markdown("---")
+                with col2:
+                    if st.form_submit_button("❌ Cancel", use_container_width=True):
+                        st.session_state.active_procedure_index = None
+                        rerun_fragment()
+        
+        st.markdown("---")
 
 def generate_procedures_report():
     """Generate a quick procedures report"""
@@ -1507,23 +1752,22 @@ def generate_procedures_report():
         st.warning("No procedures to report")
         return
     
-    total_cost = sum(p['official_fees'] + p.get('unofficial_payments', 0) for p in st.session_state.procedures_list)
-    total_time = sum(p['total_days'] for p in st.session_state.procedures_list)
-    avg_complexity = sum(p['complexity'] for p in st.session_state.procedures_list) / len(st.session_state.procedures_list)
+    summary = session_procedures_summary()
     
     st.subheader("📈 Quick Procedures Report")
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Procedures", len(st.session_state.procedures_list))
+        st.metric("Total Procedures", summary['total_procedures'])
     with col2:
-        st.metric("Total Cost", f"ZMW {total_cost:,.0f}")
+        st.metric("Total Cost", f"ZMW {summary['total_cost']:,.0f}")
     with col3:
-        st.metric("Total Time", f"{total_time} days")
+        st.metric("Total Time", f"{summary['total_time']} days")
     with col4:
-        st.metric("Avg Complexity", f"{avg_complexity:.1f}/5")
+        st.metric("Avg Complexity", f"{summary['avg_complexity']:.1f}/5")
 
 # Section C - Ongoing Compliance
+@st.fragment
 def display_section_c():
     """Section C - Ongoing Compliance"""
     st.header("⏱️ SECTION C: Ongoing Compliance Burden")
@@ -1539,51 +1783,43 @@ def display_section_c():
         with col3:
             dk_time = st.slider("Don't Know/Other (%)", 0, 100, 0, key="dk_time")
         
-        total_time = local_time + national_time + dk_time
+        time_shares = np.array([local_time, national_time, dk_time], dtype=np.int16)
+        total_time = int(time_shares.sum())
         if total_time != 100:
             st.warning(f"⚠️ Percentages sum to {total_time}%. Should be 100%.")
         
         st.subheader("C2. Cost Assessment")
-        cost_percentage = st.slider("Compliance costs as percentage of annual turnover (%)", 
-                                  0.0, 50.0, 0.0, 0.5, key="cost_percentage")
+        st.slider("Compliance costs as percentage of annual turnover (%)", 
+                  0.0, 50.0, 0.0, 0.5, key="cost_percentage")
         
         st.subheader("C3. Comparative Assessment")
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Number of Permits vs 2 Years Ago**")
-            permit_national = st.radio("National Permits", ["More", "Same", "Fewer", "Don't Know"], key="permit_national")
-            permit_local = st.radio("Local Council Permits", ["More", "Same", "Fewer", "Don't Know"], key="permit_local")
+            st.radio("National Permits", ["More", "Same", "Fewer", "Don't Know"], key="permit_national")
+            st.radio("Local Council Permits", ["More", "Same", "Fewer", "Don't Know"], key="permit_local")
         
         with col2:
             st.write("**Cost per Permit vs 2 Years Ago**")
-            cost_national = st.radio("National Permits Cost", ["More", "Same", "Less", "Don't Know"], key="cost_national")
-            cost_local = st.radio("Local Council Permits Cost", ["More", "Same", "Less", "Don't Know"], key="cost_local")
+            st.radio("National Permits Cost", ["More", "Same", "Less", "Don't Know"], key="cost_national")
+            st.radio("Local Council Permits Cost", ["More", "Same", "Less", "Don't Know"], key="cost_local")
         
         st.subheader("C4. Business Climate Rating")
-        climate_rating = st.select_slider("Rate this year vs last year", 
-                                        options=["Worse", "Same", "Better"],
-                                        key="climate_rating")
+        st.select_slider("Rate this year vs last year", 
+                         options=["Worse", "Same", "Better"],
+                         key="climate_rating")
         
         if st.form_submit_button("💾 Save Section C", use_container_width=True):
-            st.session_state.form_data.update({
-                'completion_time_local': local_time,
-                'completion_time_national': national_time,
-                'completion_time_dk': dk_time,
-                'compliance_cost_percentage': cost_percentage,
-                'permit_comparison_national': permit_national,
-                'permit_comparison_local': permit_local,
-                'cost_comparison_national': cost_national,
-                'cost_comparison_local': cost_local,
-                'business_climate_rating': climate_rating
-            })
+            st.session_state.form_data.update(collect_form_fields(SECTION_C_FIELDS))
             
-            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id)
+            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id, SECTION_C_COLUMNS)
             if interview_id:
                 st.session_state.current_interview_id = interview_id
                 st.success("✅ Section C saved successfully!")
 
 # Section D - Reform Priorities
+@st.fragment
 def display_section_d():
     """Section D - Reform Priorities"""
     st.header("💡 SECTION D: Reform Priorities & Recommendations")
@@ -1598,26 +1834,9 @@ def display_section_d():
         
         st.write("**🎯 Top Reform Priorities**")
         
-        reform_options = [
-            "Simplify application procedures",
-            "Reduce number of required documents",
-            "Standardize forms across agencies",
-            "Create single-window clearance system",
-            "Set maximum processing time limits",
-            "Implement online tracking systems",
-            "Lower official fees for small businesses",
-            "Provide fee waivers for startups",
-            "Full online application system",
-            "Digital document submission",
-            "Publish clear requirements online",
-            "Provide status updates automatically",
-            "Better inter-agency coordination",
-            "Training for regulatory staff"
-        ]
-        
         selected_reforms = []
-        for reform in reform_options:
-            if st.checkbox(reform, key=f"reform_{reform}"):
+        for reform_key, reform in REFORM_OPTION_PAIRS:
+            if st.checkbox(reform, key=reform_key):
                 selected_reforms.append(reform)
         
         st.subheader("💡 Additional Custom Recommendations")
@@ -1632,26 +1851,30 @@ def display_section_d():
             custom_list = [r.strip() for r in custom_reforms.split('\n') if r.strip()]
             selected_reforms.extend(custom_list)
         
+        # Drop repeats between checked and custom reforms, keeping first-seen order
+        selected_reforms = list(dict.fromkeys(selected_reforms))
+        
         col1, col2 = st.columns(2)
         with col1:
             save_btn = st.form_submit_button("💾 Save Section D", use_container_width=True)
         with col2:
             submit_btn = st.form_submit_button("🚀 Submit Complete Interview", use_container_width=True)
         
-        if save_btn:
+        if save_btn or submit_btn:
             st.session_state.form_data['reform_priorities'] = selected_reforms
-            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id)
+            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id, ['reform_priorities'])
             if interview_id:
                 st.session_state.current_interview_id = interview_id
-                st.success("✅ Section D saved successfully!")
-        
-        if submit_btn:
-            st.session_state.form_data['reform_priorities'] = selected_reforms
-            interview_id = save_draft(st.session_state.form_data, st.session_state.current_interview_id)
-            if interview_id and submit_final(interview_id):
-                st.balloons()
-                st.success("🎉 Interview submitted successfully!")
-                show_completion_actions()
+                if save_btn:
+                    st.success("✅ Section D saved successfully!")
+                elif submit_final(interview_id):
+                    st.session_state.completed_interview_id = interview_id
+                    st.balloons()
+                    st.success("🎉 Interview submitted successfully!")
+    
+    # Buttons are not allowed inside st.form, so completion actions render below it
+    if st.session_state.current_interview_id and st.session_state.get('completed_interview_id') == st.session_state.current_interview_id:
+        show_completion_actions()
 
 def show_completion_actions():
     """Show actions after interview completion"""
@@ -1678,8 +1901,10 @@ def reset_interview():
     st.session_state.current_interview_id = None
     st.session_state.form_data = {}
     st.session_state.procedures_list = []
+    sync_procedures_df()
     st.session_state.selected_isic_codes = []
-    st.session_state.business_activities_text = ""
+    st.session_state.pop('business_activities_form', None)
+    st.session_state.pop('business_activities_desc', None)
     st.session_state.current_section = 'A'
     st.success("🔄 New interview started!")
     st.rerun()
@@ -1694,6 +1919,9 @@ def admin_navigation():
     if st.sidebar.button("🚪 Logout", use_container_width=True, key="admin_logout_btn"):
         logout()
     
+    with st.sidebar:
+        log_flush_timer()
+    
     st.sidebar.markdown("---")
     
     menu_options = {
@@ -1722,6 +1950,61 @@ def admin_navigation():
     elif selected_menu == 'System Tools':
         database_tools_section()
 
+def top_categories(counts, k=15):
+    """Keep the k largest categories of a value_counts series and bucket the rest as Other"""
+    if len(counts) <= k:
+        return counts
+    counts = counts.sort_values(ascending=False)
+    return pd.concat([counts.head(k), pd.Series({'Other': counts.iloc[k:].sum()})])
+
+# Chart specs are cached as plain dicts. st.plotly_chart still imports plotly and validates
+# the figure on every render, so the cache only skips building it with plotly.express
+@st.cache_data(show_spinner=False)
+def sector_pie_spec(sectors, counts):
+    """Plotly spec for the interviews-by-sector pie"""
+    return {
+        "data": [{"type": "pie", "labels": list(sectors), "values": list(counts)}],
+        "layout": {"title": {"text": "Interviews by Sector"}}
+    }
+
+@st.cache_data(show_spinner=False)
+def district_bar_spec(districts, counts):
+    """Plotly spec for the interviews-by-district bar chart, one trace per district"""
+    return {
+        "data": [{"type": "bar", "name": district, "x": [district], "y": [count]}
+                 for district, count in zip(districts, counts)],
+        "layout": {"title": {"text": "Interviews by District"},
+                   "xaxis": {"title": {"text": "district"}},
+                   "yaxis": {"title": {"text": "count"}}}
+    }
+
+@st.cache_data(show_spinner=False)
+def user_bar_spec(users, totals):
+    """Plotly spec for the interviews-by-user bar chart, one trace per user"""
+    return {
+        "data": [{"type": "bar", "name": user, "x": [user], "y": [total]}
+                 for user, total in zip(users, totals)],
+        "layout": {"title": {"text": "Interviews by User"},
+                   "xaxis": {"title": {"text": "created_by"}},
+                   "yaxis": {"title": {"text": "total_interviews"}}}
+    }
+
+@st.cache_data(show_spinner=False)
+def status_pie_spec(statuses, counts):
+    """Plotly spec for an interviewer's interview status pie"""
+    return {
+        "data": [{"type": "pie", "labels": list(statuses), "values": list(counts)}],
+        "layout": {"title": {"text": "Interview Status Distribution"}, "uirevision": "constant"}
+    }
+
+@st.cache_data(show_spinner=False)
+def sector_bar_spec(sectors, counts):
+    """Plotly spec for an interviewer's interviews-by-sector bar chart"""
+    return {
+        "data": [{"type": "bar", "x": list(sectors), "y": list(counts)}],
+        "layout": {"title": {"text": "Interviews by Sector"}, "uirevision": "constant"}
+    }
+
 def admin_dashboard():
     """Admin dashboard"""
     st.title("🔧 Admin Dashboard")
@@ -1729,7 +2012,8 @@ def admin_dashboard():
     
     st.header("📈 Database Statistics")
     
-    stats = get_database_stats()
+    stats = cached_database_stats(st.session_state.current_user, st.session_state.user_role,
+                                  st.session_state.db_version)
     
     if stats:
         col1, col2, col3, col4 = st.columns(4)
@@ -1749,43 +2033,60 @@ def admin_dashboard():
         
         with col1:
             if not stats['sector_dist'].empty:
-                fig_sector = px.pie(stats['sector_dist'], values='count', names='primary_sector', 
-                                  title="Interviews by Sector")
+                fig_sector = sector_pie_spec(tuple(stats['sector_dist']['primary_sector'].tolist()),
+                                             tuple(stats['sector_dist']['count'].tolist()))
                 st.plotly_chart(fig_sector, use_container_width=True)
         
         with col2:
             if not stats['district_dist'].empty:
-                fig_district = px.bar(stats['district_dist'], x='district', y='count',
-                                    title="Interviews by District", color='district')
+                fig_district = district_bar_spec(tuple(stats['district_dist']['district'].tolist()),
+                                                 tuple(stats['district_dist']['count'].tolist()))
                 st.plotly_chart(fig_district, use_container_width=True)
     
     st.header("💾 Data Management")
     
-    tab1, tab2, tab3 = st.tabs(["All Interviews", "Search & Filter", "Data Export"])
+    # st.tabs renders every tab body on each rerun, so only the selected view is drawn here
+    data_view = st.radio("View", ["All Interviews", "Search & Filter", "Data Export"],
+                         horizontal=True, label_visibility="collapsed", key="admin_data_view")
     
-    with tab1:
+    if data_view == "All Interviews":
         display_all_interviews()
-    
-    with tab2:
-        search_and_filter_interviews()
-    
-    with tab3:
-        data_export_section()
+    elif data_view == "Search & Filter":
+        search_and_filter_interviews(cached_all_interviews(st.session_state.db_version))
+    else:
+        data_export_section(cached_all_interviews(st.session_state.db_version))
 
+@st.fragment
 def display_all_interviews():
-    """Display all interviews"""
-    interviews_df = get_all_interviews()
+    """Display all interviews, one page at a time"""
+    total_records = cached_interview_count(st.session_state.db_version)
     
-    if not interviews_df.empty:
-        st.write(f"**Total Records:** {len(interviews_df)}")
+    if total_records:
+        st.write(f"**Total Records:** {total_records}")
+        
+        total_pages = max(1, -(-total_records // INTERVIEWS_PAGE_SIZE))
+        page_num = st.number_input("Page", min_value=1, max_value=total_pages, value=1, key="interviews_page_num")
+        interviews_df = get_interviews_page((page_num - 1) * INTERVIEWS_PAGE_SIZE, INTERVIEWS_PAGE_SIZE)
+        if interviews_df.empty:
+            # Rows can be deleted between the count and the page query
+            st.info("No interviews on this page. Go back a page to see the remaining records.")
+            return
         
         display_df = interviews_df.copy()
         if 'submission_date' in display_df.columns:
-            display_df['submission_date'] = display_df['submission_date'].apply(lambda x: x.split('.')[0] if x else '')
+            display_df['submission_date'] = display_df['submission_date'].fillna('').astype(str).str.split('.', n=1).str[0]
         if 'last_modified' in display_df.columns:
-            display_df['last_modified'] = display_df['last_modified'].apply(lambda x: x.split('.')[0] if x else '')
+            display_df['last_modified'] = display_df['last_modified'].fillna('').astype(str).str.split('.', n=1).str[0]
         
-        st.dataframe(display_df, use_container_width=True)
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'risk_score': st.column_config.NumberColumn("Risk Score", format="%.1f")
+            }
+        )
+        st.caption(f"Page {page_num} of {total_pages}")
         
         st.subheader("📋 Interview Details")
         selected_interview = st.selectbox("Select interview to view details:", 
@@ -1797,12 +2098,11 @@ def display_all_interviews():
     else:
         st.info("No interviews found in the database.")
 
-def search_and_filter_interviews():
+@st.fragment
+def search_and_filter_interviews(interviews_df):
     """Search and filter interviews"""
     st.subheader("🔍 Search & Filter Interviews")
     
-    interviews_df = get_all_interviews()
-    
     if not interviews_df.empty:
         col1, col2, col3 = st.columns(3)
         
@@ -1825,7 +2125,12 @@ def search_and_filter_interviews():
             filtered_df = filtered_df[filtered_df['status'].isin(status_filter)]
         
         st.write(f"**Filtered Results:** {len(filtered_df)} interviews")
-        st.dataframe(filtered_df, use_container_width=True)
+        page_count = max(1, -(-len(filtered_df) // INTERVIEWS_PAGE_SIZE))
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="filtered_page")
+        page_start = (page - 1) * INTERVIEWS_PAGE_SIZE
+        st.dataframe(filtered_df.iloc[page_start:page_start + INTERVIEWS_PAGE_SIZE], use_container_width=True)
         
         if not filtered_df.empty:
             csv = filtered_df.to_csv(index=False)
@@ -1839,65 +2144,136 @@ def search_and_filter_interviews():
     else:
         st.info("No interviews available for filtering.")
 
-def data_export_section():
+def write_export_sheet(workbook, sheet_name, df):
+    """Write a DataFrame row by row, as xlsxwriter's constant_memory mode requires"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, list(df.columns))
+    values = df.astype(object).where(df.notna(), None)
+    for row_index, row in enumerate(values.itertuples(index=False, name=None), 1):
+        worksheet.write_row(row_index, 0, row)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def export_csv_bytes(db_version):
+    """Full CSV export, cached until db_version changes"""
+    # Errors propagate to the caller, so a partial export is never cached
+    def write_csv(conn):
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        cursor = conn.cursor()
+        cursor.execute(ALL_INTERVIEWS_QUERY)
+        writer.writerow([column[0] for column in cursor.description])
+        # Stream rows in chunks instead of building a DataFrame of the whole table
+        rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+        while rows:
+            writer.writerows(rows)
+            rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+        return output.getvalue().encode()
+    
+    return run_with_connection(write_csv)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def export_excel_bytes(db_version):
+    """Full Excel export with summary sheet, cached until db_version changes"""
+    import xlsxwriter
+    
+    interviews_df = cached_all_interviews(db_version)
+    
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    write_export_sheet(workbook, 'Interviews', interviews_df)
+    
+    summary_data = {
+        'Metric': ['Total Interviews', 'Submitted', 'Drafts', 'Average Risk Score'],
+        'Value': [
+            len(interviews_df),
+            len(interviews_df[interviews_df['status'] == 'submitted']),
+            len(interviews_df[interviews_df['status'] == 'draft']),
+            interviews_df['risk_score'].mean() if 'risk_score' in interviews_df.columns else 0
+        ]
+    }
+    write_export_sheet(workbook, 'Summary', pd.DataFrame(summary_data))
+    workbook.close()
+    
+    return output.getvalue()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def export_json_bytes(db_version):
+    """Full JSON export, cached until db_version changes"""
+    return cached_all_interviews(db_version).to_json(orient='records', indent=2).encode()
+
+@st.fragment
+def data_export_section(interviews_df):
     """Data export section"""
     st.subheader("📤 Data Export")
     
-    interviews_df = get_all_interviews()
+    db_version = st.session_state.db_version
     
     if not interviews_df.empty:
+        # Excel and JSON are only built once requested, then served from the cache
+        prepared_exports = st.session_state.setdefault('prepared_exports', set())
         col1, col2 = st.columns(2)
         
         with col1:
-            csv = interviews_df.to_csv(index=False)
-            st.download_button(
-                label="💾 Download Full Data (CSV)",
-                data=csv,
-                file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv",
-                use_container_width=True,
-                key="download_full_csv"
-            )
+            try:
+                csv_bytes = export_csv_bytes(db_version)
+            except Exception as e:
+                st.error(f"Error exporting interviews: {str(e)}")
+            else:
+                st.download_button(
+                    label="💾 Download Full Data (CSV)",
+                    data=csv_bytes,
+                    file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv",
+                    use_container_width=True,
+                    key="download_full_csv"
+                )
         
         with col2:
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                interviews_df.to_excel(writer, sheet_name='Interviews', index=False)
-                
-                summary_data = {
-                    'Metric': ['Total Interviews', 'Submitted', 'Drafts', 'Average Risk Score'],
-                    'Value': [
-                        len(interviews_df),
-                        len(interviews_df[interviews_df['status'] == 'submitted']),
-                        len(interviews_df[interviews_df['status'] == 'draft']),
-                        interviews_df['risk_score'].mean() if 'risk_score' in interviews_df.columns else 0
-                    ]
-                }
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-            
-            excel_data = output.getvalue()
+            if 'excel' not in prepared_exports and st.button("📊 Prepare Excel Export", use_container_width=True, key="prepare_excel_btn"):
+                prepared_exports.add('excel')
+            if 'excel' in prepared_exports:
+                st.download_button(
+                    label="📊 Download Full Data (Excel)",
+                    data=export_excel_bytes(db_version),
+                    file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    use_container_width=True,
+                    key="download_full_excel"
+                )
+        
+        st.write("**JSON Export**")
+        if 'json' not in prepared_exports and st.button("🔤 Prepare JSON Export", use_container_width=True, key="prepare_json_btn"):
+            prepared_exports.add('json')
+        if 'json' in prepared_exports:
             st.download_button(
-                label="📊 Download Full Data (Excel)",
-                data=excel_data,
-                file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                label="🔤 Download Full Data (JSON)",
+                data=export_json_bytes(db_version),
+                file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.json",
+                mime="application/json",
                 use_container_width=True,
-                key="download_full_excel"
+                key="download_full_json"
             )
-        
-        st.write("**JSON Export**")
-        json_data = interviews_df.to_json(orient='records', indent=2)
-        st.download_button(
-            label="🔤 Download Full Data (JSON)",
-            data=json_data,
-            file_name=f"compliance_data_{datetime.now().strftime('%Y%m%d')}.json",
-            mime="application/json",
-            use_container_width=True,
-            key="download_full_json"
-        )
     else:
         st.info("No data available for export.")
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_user_statistics(db_version):
+    """Get per-user interview counts"""
+    result = execute_query("""
+        SELECT created_by, 
+               COUNT(*) as total_interviews,
+               SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted,
+               SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as drafts
+        FROM responses 
+        GROUP BY created_by
+        ORDER BY total_interviews DESC
+    """, return_result=True)
+    
+    if result and isinstance(result, tuple) and result[0]:
+        result_data, columns = result
+        return pd.DataFrame(result_data, columns=columns)
+    return pd.DataFrame()
+
 def user_management_section():
     """User management section"""
     st.header("👥 User Management")
@@ -1908,28 +2284,14 @@ def user_management_section():
         st.subheader("User Statistics")
         
         try:
-            result = execute_query("""
-                SELECT created_by, 
-                       COUNT(*) as total_interviews,
-                       SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted,
-                       SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as drafts
-                FROM responses 
-                GROUP BY created_by
-                ORDER BY total_interviews DESC
-            """, return_result=True)
+            user_stats = get_user_statistics(st.session_state.db_version)
             
-            if result and isinstance(result, tuple) and result[0]:
-                result_data, columns = result
-                user_stats = pd.DataFrame(result_data, columns=columns)
+            if not user_stats.empty:
+                st.dataframe(user_stats, use_container_width=True)
                 
-                if not user_stats.empty:
-                    st.dataframe(user_stats, use_container_width=True)
-                    
-                    fig = px.bar(user_stats, x='created_by', y='total_interviews', 
-                               title="Interviews by User", color='created_by')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No user statistics available yet.")
+                fig = user_bar_spec(tuple(user_stats['created_by'].tolist()),
+                                    tuple(user_stats['total_interviews'].tolist()))
+                st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("No user statistics available yet.")
         except Exception as e:
@@ -1939,13 +2301,21 @@ def user_management_section():
         st.subheader("User Session Logs")
         display_user_sessions()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def recent_log_rows(query, log_version):
+    """Cached rows of a log query, cleared whenever queued log entries are written"""
+    result = execute_query(query, return_result=True)
+    if result and isinstance(result, tuple) and result[0]:
+        result_data, columns = result
+        return pd.DataFrame(result_data, columns=columns)
+    return pd.DataFrame()
+
 def display_user_sessions():
     """Display user session logs"""
     try:
-        result = execute_query("SELECT * FROM user_sessions ORDER BY login_time DESC LIMIT 100", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            result_data, columns = result
-            sessions_df = pd.DataFrame(result_data, columns=columns)
+        flush_log_queues()
+        sessions_df = recent_log_rows(RECENT_SESSIONS_QUERY, st.session_state.get('log_version', 0))
+        if not sessions_df.empty:
             st.dataframe(sessions_df, use_container_width=True)
         else:
             st.info("No session logs found.")
@@ -1973,6 +2343,7 @@ def database_tools_section():
                     try:
                         result = execute_query("DELETE FROM responses WHERE status = 'draft'")
                         if result:
+                            bump_db_version()
                             st.success("All draft interviews deleted!")
                             log_admin_action(st.session_state.current_user, "clear_drafts")
                             st.rerun()
@@ -1987,10 +2358,9 @@ def database_tools_section():
 def display_admin_logs():
     """Display admin action logs"""
     try:
-        result = execute_query("SELECT * FROM admin_logs ORDER BY timestamp DESC LIMIT 100", return_result=True)
-        if result and isinstance(result, tuple) and result[0]:
-            result_data, columns = result
-            logs_df = pd.DataFrame(result_data, columns=columns)
+        flush_log_queues()
+        logs_df = recent_log_rows(RECENT_ADMIN_LOGS_QUERY, st.session_state.get('log_version', 0))
+        if not logs_df.empty:
             st.subheader("📝 Admin Action Logs")
             st.dataframe(logs_df, use_container_width=True)
         else:
@@ -1998,9 +2368,16 @@ def display_admin_logs():
     except Exception as e:
         st.error(f"Error loading admin logs: {str(e)}")
 
+@st.cache_data(show_spinner=False)
+def parse_interview_json(interview_id, procedure_json, reforms_json):
+    """Parse stored procedure and reform JSON once per interview"""
+    procedures = json.loads(procedure_json) if procedure_json else []
+    reforms = json.loads(reforms_json) if reforms_json else []
+    return procedures, reforms
+
 def display_interview_details(interview_id):
     """Display detailed interview information"""
-    details_df = get_interview_details(interview_id)
+    details_df = get_interview_details(interview_id, INTERVIEW_DETAIL_COLUMNS)
     
     if not details_df.empty:
         interview = details_df.iloc[0]
@@ -2022,9 +2399,10 @@ def display_interview_details(interview_id):
             st.write(f"**Risk Score:** {interview['risk_score']:.1f}/10")
             st.write(f"**Status:** {interview['status']}")
         
-        if interview['procedure_data']:
+        procedures, reforms = parse_interview_json(interview_id, interview['procedure_data'], interview['reform_priorities'])
+        
+        if procedures:
             st.write("**Procedures**")
-            procedures = json.loads(interview['procedure_data'])
             for i, proc in enumerate(procedures, 1):
                 with st.expander(f"{i}. {proc['procedure']}"):
                     st.write(f"**Authority:** {proc['authority']}")
@@ -2033,32 +2411,28 @@ def display_interview_details(interview_id):
                     st.write(f"**Time:** {proc['total_days']} days")
                     st.write(f"**Complexity:** {proc['complexity']}/5")
         
-        if interview['reform_priorities']:
+        if reforms:
             st.write("**Reform Priorities**")
-            reforms = json.loads(interview['reform_priorities'])
             for i, reform in enumerate(reforms, 1):
                 st.write(f"{i}. {reform}")
 
 # Data Collection Navigation
 def data_collection_navigation():
     """Data collection navigation for interviewers"""
+    # Re-assigning the activity text keys keeps their state while Section A is not rendered
+    for key in ('business_activities_form', 'business_activities_desc'):
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+    
     st.sidebar.title("📋 Interview Panel")
     st.sidebar.write(f"Interviewer: **{st.session_state.current_user}**")
     
     if st.sidebar.button("🚪 Logout", use_container_width=True, key="interviewer_logout_btn"):
         logout()
     
-    user_interviews = get_user_interviews(st.session_state.current_user)
-    if not user_interviews.empty:
-        st.sidebar.markdown("---")
-        st.sidebar.header("📈 My Statistics")
-        total = len(user_interviews)
-        submitted = len(user_interviews[user_interviews['status'] == 'submitted'])
-        drafts = len(user_interviews[user_interviews['status'] == 'draft'])
-        
-        st.sidebar.write(f"**Total:** {total}")
-        st.sidebar.write(f"**Submitted:** {submitted}")
-        st.sidebar.write(f"**Drafts:** {drafts}")
+    with st.sidebar:
+        sidebar_user_statistics()
+        log_flush_timer()
     
     display_draft_quick_access()
     
@@ -2078,9 +2452,7 @@ def data_collection_navigation():
                                       format_func=lambda x: f"Section {x}: {sections[x]}" if x in ['A','B','C','D'] else sections[x],
                                       key="main_navigation")
     
-    if selected_section != st.session_state.current_section:
-        st.session_state.current_section = selected_section
-        st.rerun()
+    st.session_state.current_section = selected_section
     
     if st.session_state.current_section == 'A':
         display_section_a()
@@ -2097,61 +2469,77 @@ def data_collection_navigation():
     elif st.session_state.current_section == 'Draft_Dashboard':
         display_draft_dashboard()
 
+@st.fragment(run_every="60s")
+def sidebar_user_statistics():
+    """Sidebar statistics for the logged-in interviewer"""
+    user_interviews = cached_user_interviews(st.session_state.current_user, st.session_state.db_version)
+    if not user_interviews.empty:
+        st.markdown("---")
+        st.header("📈 My Statistics")
+        total, submitted, drafts = user_status_counts(st.session_state.current_user, st.session_state.db_version)
+        
+        st.write(f"**Total:** {total}")
+        st.write(f"**Submitted:** {submitted}")
+        st.write(f"**Drafts:** {drafts}")
+
+@st.fragment
 def display_interviewer_dashboard():
     """Dashboard for individual interviewer"""
     st.header("📊 My Interview Dashboard")
     
-    user_interviews = get_user_interviews(st.session_state.current_user)
+    user_interviews = cached_user_interviews(st.session_state.current_user, st.session_state.db_version)
     
     if not user_interviews.empty:
+        total, submitted, drafts = user_status_counts(st.session_state.current_user, st.session_state.db_version)
+        
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Interviews", len(user_interviews))
+            st.metric("Total Interviews", total)
         with col2:
-            submitted = len(user_interviews[user_interviews['status'] == 'submitted'])
             st.metric("Submitted", submitted)
         with col3:
-            drafts = len(user_interviews[user_interviews['status'] == 'draft'])
             st.metric("Drafts", drafts)
         with col4:
-            completion_rate = (submitted / len(user_interviews)) * 100 if len(user_interviews) > 0 else 0
+            completion_rate = 100 * submitted / total if total else 0
             st.metric("Completion Rate", f"{completion_rate:.1f}%")
         
         st.subheader("📋 My Recent Interviews")
-        st.dataframe(user_interviews, use_container_width=True)
+        st.dataframe(user_interviews[INTERVIEW_SUMMARY_COLUMNS].head(INTERVIEWS_PAGE_SIZE),
+                     use_container_width=True, hide_index=True, height=400)
+        if len(user_interviews) > INTERVIEWS_PAGE_SIZE:
+            with st.expander(f"Show all {len(user_interviews)} interviews"):
+                st.dataframe(user_interviews, use_container_width=True, hide_index=True, height=400)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            status_counts = user_interviews['status'].value_counts()
-            fig_status = px.pie(values=status_counts.values, names=status_counts.index, 
-                              title="Interview Status Distribution")
-            st.plotly_chart(fig_status, use_container_width=True)
+            status_counts = top_categories(user_interviews['status'].value_counts())
+            fig_status = status_pie_spec(tuple(status_counts.index.tolist()), tuple(status_counts.tolist()))
+            st.plotly_chart(fig_status, use_container_width=True, config=STATIC_CHART_CONFIG)
         
         with col2:
             if 'primary_sector' in user_interviews.columns:
-                sector_counts = user_interviews['primary_sector'].value_counts()
-                fig_sector = px.bar(x=sector_counts.index, y=sector_counts.values,
-                                  title="Interviews by Sector", color=sector_counts.index)
-                st.plotly_chart(fig_sector, use_container_width=True)
+                sector_counts = top_categories(user_interviews['primary_sector'].value_counts(), k=10)
+                fig_sector = sector_bar_spec(tuple(sector_counts.index.tolist()), tuple(sector_counts.tolist()))
+                st.plotly_chart(fig_sector, use_container_width=True, config=STATIC_CHART_CONFIG)
     else:
         st.info("You haven't conducted any interviews yet. Start with Section A!")
 
+@st.fragment
 def display_interviewer_data_management():
     """Data management for individual interviewer"""
     st.header("💾 My Data Management")
     
-    user_interviews = get_user_interviews(st.session_state.current_user)
+    user_interviews = cached_user_interviews(st.session_state.current_user, st.session_state.db_version)
     
     if not user_interviews.empty:
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Export My Data")
-            csv_data = user_interviews.to_csv(index=False)
             st.download_button(
                 label="📥 Download My Interviews (CSV)",
-                data=csv_data,
+                data=user_csv_bytes(st.session_state.current_user, st.session_state.db_version),
                 file_name=f"my_interviews_{st.session_state.current_user}_{datetime.now().strftime('%Y%m%d')}.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -2171,20 +2559,25 @@ def display_interviewer_data_management():
 
 # Main Application
 def main():
-    # Test database connection
-    if not test_connection():
-        st.error("Cannot proceed without database connection")
-        return
-    
-    # Initialize database
-    if not check_and_fix_database():
-        st.error("Failed to initialize database. Please check your connection.")
-        return
-    
-    initialize_session_state()
-    
-    # Run database migrations
-    add_missing_columns()
+    # Connection test, schema check and migrations only need to run once per session
+    if not st.session_state.get('bootstrapped'):
+        # Test database connection
+        if not test_connection():
+            st.error("Cannot proceed without database connection")
+            return
+        
+        # Initialize database
+        if not check_and_fix_database():
+            st.error("Failed to initialize database. Please check your connection.")
+            return
+        
+        initialize_session_state()
+        
+        # Run database migrations
+        add_missing_columns()
+        add_missing_indexes()
+        
+        st.session_state.bootstrapped = True
     
     # Route based on login status
     if not st.session_state.interviewer_logged_in and not st.session_state.admin_logged_in:
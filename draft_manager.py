@@ -158,6 +158,10 @@ class DraftManager:
                 return False
                 
             result = execute_query("DELETE FROM responses WHERE interview_id = ? AND status = 'draft'", (interview_id,))
+            if result:
+                st.session_state.db_version = st.session_state.get('db_version', 0) + 1
+                # The app's query caches are shared by every session
+                st.cache_data.clear()
             return result is not None
         except Exception as e:
             st.error(f"Error deleting draft: {str(e)}")
@@ -218,8 +222,8 @@ def display_draft_dashboard():
     if not drafts_df.empty:
         st.subheader(f"{user_type} Draft Interviews ({len(drafts_df)})")
         
-        for index, draft in drafts_df.iterrows():
-            display_draft_card(draft_manager, draft, index)
+        for _, draft in drafts_df.iterrows():
+            display_draft_card(draft_manager, draft)
     else:
         st.info("💡 No draft interviews found. Start a new interview to create drafts!")
     
@@ -238,7 +242,7 @@ def display_draft_dashboard():
         if st.button("🔄 Refresh", use_container_width=True, key="refresh_drafts"):
             st.rerun()
 
-def display_draft_card(draft_manager, draft, index):
+def display_draft_card(draft_manager, draft):
     """Display a draft as a card with actions"""
     with st.container():
         st.markdown("---")
@@ -264,16 +268,21 @@ def display_draft_card(draft_manager, draft, index):
             st.progress(progress / 100)
         
         with col2:
-            if st.button("➡️ Continue", key=f"continue_{index}", use_container_width=True):
+            if st.button("➡️ Continue", key=f"continue_{draft['interview_id']}", use_container_width=True):
                 load_draft_into_session(draft_manager, draft['interview_id'])
                 st.rerun()
         
         with col3:
-            if st.button("🗑️ Delete", key=f"delete_{index}", use_container_width=True):
+            if st.button("🗑️ Delete", key=f"delete_{draft['interview_id']}", use_container_width=True):
                 if draft_manager.delete_draft(draft['interview_id']):
                     st.success("✅ Draft deleted successfully!")
                     st.rerun()
 
+def calculate_procedure_risk(procedure):
+    """Calculate risk score for a single procedure, matching the survey app"""
+    cost = procedure.get('official_fees', 0) + procedure.get('unofficial_payments', 0)
+    return (procedure.get('complexity', 3) * 2 + min(cost / 5000, 10) + min(procedure.get('total_days', 0) / 30, 10)) / 3
+
 def load_draft_into_session(draft_manager, interview_id):
     """Load a draft into the current session"""
     draft_data = draft_manager.load_draft(interview_id)
@@ -321,6 +330,11 @@ def load_draft_into_session(draft_manager, interview_id):
                 st.session_state.procedures_list = []
         else:
             st.session_state.procedures_list = []
+        # Procedures saved before risk scores were stored get theirs once, here
+        for procedure in st.session_state.procedures_list:
+            if 'risk_score' not in procedure:
+                procedure['risk_score'] = calculate_procedure_risk(procedure)
+        st.session_state.procedures_df = pd.DataFrame(st.session_state.procedures_list)
         
         isic_json = draft_data.get('isic_codes')
         if isic_json and isic_json != 'null' and isic_json != '[]':
@@ -331,7 +345,9 @@ def load_draft_into_session(draft_manager, interview_id):
         else:
             st.session_state.selected_isic_codes = []
         
-        st.session_state.business_activities_text = draft_data.get('business_activities', '')
+        # Seed both activity text boxes; their keys hold the state
+        st.session_state.business_activities_form = draft_data.get('business_activities', '') or ''
+        st.session_state.business_activities_desc = st.session_state.business_activities_form
         
         st.session_state.current_section = draft_data.get('current_section', 'A')
         
@@ -353,13 +369,13 @@ def display_draft_quick_access():
             st.sidebar.markdown("---")
             st.sidebar.subheader("📝 Your Drafts")
             
-            for index, draft in drafts_df.head(3).iterrows():
+            for _, draft in drafts_df.head(3).iterrows():
                 business_name = draft['business_name'] or 'Unnamed Business'
                 progress = draft['draft_progress'] or 0
                 
                 if st.sidebar.button(
                     f"➡️ {business_name[:20]}... ({progress}%)", 
-                    key=f"sidebar_draft_{index}",
+                    key=f"sidebar_draft_{draft['interview_id']}",
                     use_container_width=True
                 ):
                     load_draft_into_session(draft_manager, draft['interview_id'])
@@ -4,6 +4,7 @@ import pandas as pd
 from datetime import datetime
 import json
 import sqlitecloud
+from draft_manager import calculate_procedure_risk
 
 # SQLite Cloud configuration
 SQLITECLOUD_CONFIG = {
@@ -123,6 +124,9 @@ class InterviewEditor:
             result = execute_query(query, values)
             
             if result:
+                st.session_state.db_version = st.session_state.get('db_version', 0) + 1
+                # The app's query caches are shared by every session
+                st.cache_data.clear()
                 self.log_edit_action(st.session_state.current_user, interview_id, updates)
             
             return result is not None
@@ -168,6 +172,9 @@ class InterviewEditor:
             ''', (datetime.now().isoformat(), interview_id))
             
             if result:
+                st.session_state.db_version = st.session_state.get('db_version', 0) + 1
+                # The app's query caches are shared by every session
+                st.cache_data.clear()
                 self.log_edit_action(st.session_state.current_user, interview_id, {'status': 'reverted_to_draft'})
             
             return result is not None
@@ -538,9 +545,10 @@ def edit_single_procedure(editor, interview_id, procedures, index, procedure):
                 'total_days': total_days,
                 'complexity': complexity
             })
+            procedures[index]['risk_score'] = calculate_procedure_risk(procedures[index])
             
             updates = {
-                'procedure_data': json.dumps(procedures)
+                'procedure_data': json.dumps(procedures, separators=(',', ':'))
             }
             
             if editor.update_interview(interview_id, updates):
@@ -647,6 +655,9 @@ def delete_interview(editor, interview_id):
         result = execute_query("DELETE FROM responses WHERE interview_id = ?", (interview_id,))
         
         if result:
+            st.session_state.db_version = st.session_state.get('db_version', 0) + 1
+            # The app's query caches are shared by every session
+            st.cache_data.clear()
             editor.log_edit_action(st.session_state.current_user, interview_id, {'action': 'permanent_deletion'})
             st.success("✅ Interview deleted successfully!")
             st.rerun()